@@ -112,4 +112,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is an optional speedup (pip install "pokemon-meetup[speedups]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
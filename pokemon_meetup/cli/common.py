@@ -0,0 +1,160 @@
+"""Interactive helpers shared by the meetup scripts.
+
+The template manager here is cached at module level, so scripts run from the same
+process (e.g. through main.py) share it.
+"""
+
+import re
+from functools import cache
+from typing import TYPE_CHECKING
+
+from pokemon_meetup.templates.manager import TemplateManager, get_template_manager
+from pokemon_meetup.web.pokemon_api import PokemonData
+
+if TYPE_CHECKING:
+    from pokemon_meetup.services.pokemon_service import PokemonService
+
+
+# Accepted answers for the yes/no prompts
+YES_ANSWERS = frozenset(("y", "yes", "1"))
+NO_ANSWERS = frozenset(("n", "no", "0"))
+COPY_YES_ANSWERS = frozenset(("y", "yes"))
+
+# Whole numbers accepted by prompt_int (ASCII digits only, as int() rejects other Unicode digits such as "²")
+_NUM_RE = re.compile(r"[0-9]+")
+
+
+@cache
+def get_shared_template_manager() -> TemplateManager:
+    """Get the template manager shared by the scripts.
+
+    Returns:
+        TemplateManager instance, created on first use.
+    """
+    return get_template_manager()
+
+
+def prompt_int(*, prompt: str, low: int, high: int) -> int:
+    """Prompt until the user enters a whole number within a range.
+
+    Args:
+        prompt: Text shown when asking for the number.
+        low: Smallest accepted value.
+        high: Largest accepted value.
+
+    Returns:
+        The number entered by the user.
+    """
+    while True:
+        choice = input(prompt).strip()
+
+        if not _NUM_RE.fullmatch(choice):
+            print("❌ Please enter a valid number.")
+            continue
+
+        choice_num = int(choice)
+        if low <= choice_num <= high:
+            return choice_num
+
+        print(f"❌ Please enter a number between {low} and {high}.")
+
+
+def format_type_info(*, pokemon_data: PokemonData) -> str:
+    """Format Pokémon type information with Spanish names and emojis.
+
+    Args:
+        pokemon_data: PokemonData object containing type information.
+
+    Returns:
+        Formatted string with type names and emojis in Spanish.
+    """
+    return get_shared_template_manager()._format_type_info(pokemon_data=pokemon_data)
+
+
+async def get_pokemon_input(
+    *, service: "PokemonService", prompt: str = "\n🔍 Enter Pokémon name: "
+) -> tuple[str, bool, PokemonData | None]:
+    """Get Pokémon name input from user with search suggestions.
+
+    Args:
+        service: PokemonService instance for searching.
+        prompt: Text shown when asking for the name.
+
+    Returns:
+        Tuple of (pokemon_name, was_just_fetched, pokemon_data) where was_just_fetched indicates
+        if the data was just fetched from API in this function, and pokemon_data is the record
+        already loaded for the name (None if it still has to be fetched).
+    """
+    # Bound once, as every retry of the loop below calls them again
+    get_pokemon_data = service.get_pokemon_data
+    search_pokemon_with_data = service.search_pokemon_with_data
+
+    while True:
+        pokemon_name = input(prompt).strip()
+
+        if not pokemon_name:
+            print("❌ Please enter a valid name.")
+            continue
+
+        # Check if Pokémon exists in database first
+        existing_data = service.database.get_pokemon_by_name(name=pokemon_name)
+
+        if existing_data:
+            # Found in database, no need to fetch
+            return pokemon_name, False, existing_data
+
+        # Try to find exact match from API
+        pokemon_data = await get_pokemon_data(name=pokemon_name, interactive=False)
+        if pokemon_data:
+            return pokemon_name, True, pokemon_data  # Just fetched from API
+
+        # If no exact match, search for similar names
+        print(f"❌ '{pokemon_name}' not found. Searching for similar names...")
+        suggestions = await search_pokemon_with_data(partial_name=pokemon_name, limit=5)
+
+        if not suggestions:
+            print("❌ No similar Pokémon found. Try another name.")
+            continue
+
+        # The last menu entry goes back to name input
+        search_again_option = len(suggestions) + 1
+        lines = [f"  {i}. {suggestion}" for i, (suggestion, _suggestion_data) in enumerate(suggestions, 1)]
+        lines.append(f"  {search_again_option}. Search for another name")
+        print("\n📋 Pokémon found:\n" + "\n".join(lines))
+
+        choice_num = prompt_int(
+            prompt=f"\n🎯 Select an option (1-{search_again_option}): ", low=1, high=search_again_option
+        )
+        if choice_num == search_again_option:
+            continue  # Go back to name input
+
+        selected_name, existing_selected = suggestions[choice_num - 1]
+        if existing_selected is None:
+            # Names suggested by the API may still be stored in the database
+            existing_selected = service.database.get_pokemon_by_name(name=selected_name)
+        # True if not in DB (will be fetched)
+        return selected_name, not existing_selected, existing_selected
+
+
+def get_shiny_availability_input(*, pokemon_data: PokemonData) -> bool:
+    """Get shiny availability input from user.
+
+    Args:
+        pokemon_data: PokemonData object to show current API data.
+
+    Returns:
+        True if shiny is available, False otherwise.
+    """
+    api_shiny_status = "Yes" if pokemon_data.is_shiny_available else "No"
+    print(f"\n✨ Shiny availability for {pokemon_data.name}:")
+    print(f"   API data shows: {api_shiny_status}")
+
+    while True:
+        choice = input("Is shiny available for this event? (y/n): ").strip().lower()
+
+        if choice in YES_ANSWERS:
+            return True
+        elif choice in NO_ANSWERS:
+            return False
+        else:
+            print("❌ Please enter 'y' for yes or 'n' for no.")
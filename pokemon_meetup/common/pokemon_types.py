@@ -1,10 +1,14 @@
 """Pokémon type definitions with Spanish names and emojis."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class PokemonType(Enum):
-    """Pokémon types enum."""
+class PokemonType(StrEnum):
+    """Pokémon types enum.
+
+    A StrEnum hashes with str's C-level hash rather than Enum's Python-level __hash__, which keeps the lookups
+    below and the weather boost sets cheap.
+    """
 
     NORMAL = "normal"
     FIRE = "fire"
@@ -76,14 +76,33 @@ Indexes:
 - INDEX on pokemon_id for mega evolution lookups
 """
 
+import atexit
 import json
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from rapidfuzz import fuzz, process, utils
+
+from pokemon_meetup.common.pokemon_types import PokemonType
 from pokemon_meetup.web.pokemon_api import EvolutionData, MegaEvolutionData, PokemonData
 
+# Per-connection tuning applied to every connection (journal_mode=WAL is persistent and set once on init).
+# Busy waiting is already covered by the connect timeout.
+_CONNECTION_PRAGMAS = ("PRAGMA synchronous = NORMAL", "PRAGMA temp_store = MEMORY", "PRAGMA cache_size = -65536")
+_MMAP_PRAGMA = "PRAGMA mmap_size = 268435456"
+
+_GET_BY_NAME_SQL = "SELECT * FROM pokemon_data WHERE LOWER(name) = LOWER(?)"
+
+# Lowest whole-name similarity (0-100) for a stored name that does not contain the searched text to be
+# suggested as a typo of it
+_NAME_SEARCH_TYPO_CUTOFF = 75
+
+# Database files to run PRAGMA optimize on at interpreter exit
+_optimize_on_exit: set[Path] = set()
+
 
 @dataclass
 class DatabaseConfig:
@@ -107,11 +126,55 @@ class PokemonDatabase:
             config: Database configuration.
         """
         self.config = config
+        self._name_cursor: sqlite3.Cursor | None = None
         self._init_database()
 
+        if self._is_file_backed():
+            _optimize_on_exit.add(self.config.db_path)
+
+    def _is_file_backed(self) -> bool:
+        """Check if the database lives in a file rather than in memory.
+
+        Returns:
+            True unless the database path is ":memory:".
+        """
+        return str(self.config.db_path) != ":memory:"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with the tuning PRAGMAs applied.
+
+        Returns:
+            SQLite connection object.
+        """
+        conn = sqlite3.connect(self.config.db_path, timeout=self.config.timeout, cached_statements=256)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if self._is_file_backed():
+            conn.execute(_MMAP_PRAGMA)
+        return conn
+
+    def _get_name_cursor(self) -> sqlite3.Cursor:
+        """Get the long-lived cursor used for name lookups, opening its connection on first use.
+
+        Name lookups are the most frequent query, so they reuse one connection and its compiled
+        statement instead of opening a connection and parsing the SQL on every call.
+
+        Returns:
+            SQLite cursor whose rows are sqlite3.Row objects.
+        """
+        if self._name_cursor is None:
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            self._name_cursor = conn.cursor()
+        return self._name_cursor
+
     def _init_database(self) -> None:
         """Initialize the database and create tables if they don't exist."""
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
+            # WAL is stored in the database file, so readers no longer block on writers and
+            # commits skip the rollback journal fsync for every later connection
+            if self._is_file_backed():
+                conn.execute("PRAGMA journal_mode = WAL")
             conn.execute("PRAGMA foreign_keys = ON")
 
             # Create the main pokemon_data table
@@ -249,6 +312,11 @@ class PokemonDatabase:
             conn.execute("ALTER TABLE pokemon_data ADD COLUMN base_stardust INTEGER")
             print("✅ Added base_stardust column to existing database")
 
+        # Drop the write counter an earlier version kept for the Pokémon list snapshot, so writes skip its triggers
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS bump_pokemon_data_version_on_{event}")
+        conn.execute("DROP TABLE IF EXISTS pokemon_data_version")
+
     def pokemon_exists(self, *, pokemon_id: int) -> bool:
         """Check if a Pokémon exists in the database.
 
@@ -258,7 +326,7 @@ class PokemonDatabase:
         Returns:
             True if the Pokémon exists, False otherwise.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("SELECT 1 FROM pokemon_data WHERE id = ? LIMIT 1", (pokemon_id,))
             return cursor.fetchone() is not None
 
@@ -271,7 +339,7 @@ class PokemonDatabase:
         Returns:
             PokemonData object if found, None otherwise.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM pokemon_data WHERE id = ?", (pokemon_id,))
             row = cursor.fetchone()
@@ -290,15 +358,35 @@ class PokemonDatabase:
         Returns:
             PokemonData object if found, None otherwise.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM pokemon_data WHERE LOWER(name) = LOWER(?)", (name,))
-            row = cursor.fetchone()
+        cursor = self._get_name_cursor()
+        # Fetch every row so the statement is reset and no read snapshot stays open between lookups
+        rows = cursor.execute(_GET_BY_NAME_SQL, (name,)).fetchall()
 
-            if not row:
-                return None
+        if not rows:
+            return None
 
-            return self._row_to_pokemon_data(row=row)
+        return self._row_to_pokemon_data(row=rows[0])
+
+    def get_pokemon_by_names(self, *, names: list[str]) -> dict[str, PokemonData]:
+        """Retrieve several Pokémon by name with a single query.
+
+        Args:
+            names: The Pokémon names to search for (case-insensitive).
+
+        Returns:
+            Dictionary mapping lowercased names to PokemonData for the names found.
+        """
+        lowered_names = list(dict.fromkeys(name.lower() for name in names))
+        if not lowered_names:
+            return {}
+
+        placeholders = ", ".join("?" * len(lowered_names))
+        query = "SELECT * FROM pokemon_data WHERE LOWER(name) IN (" + placeholders + ")"  # noqa: S608
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, lowered_names)
+            return {row["name"].lower(): self._row_to_pokemon_data(row=row) for row in cursor.fetchall()}
 
     def upsert_pokemon(self, *, pokemon_data: PokemonData) -> None:
         """Insert or update Pokémon data in the database.
@@ -308,7 +396,7 @@ class PokemonDatabase:
         """
         types_json = json.dumps([ptype.value for ptype in pokemon_data.types])
 
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO pokemon_data (
@@ -349,57 +437,91 @@ class PokemonDatabase:
             conn.commit()
 
     def search_pokemon_by_name(self, *, partial_name: str, limit: int = 10) -> list[PokemonData]:
-        """Search for Pokémon by partial name match.
+        """Search for Pokémon whose names are similar to the given text.
+
+        A stored name matches if it contains the text, as with a LIKE search, or if RapidFuzz finds it
+        close enough as a whole to be a typo of it. Matches are ranked by RapidFuzz's WRatio score.
 
         Args:
-            partial_name: Partial name to search for.
+            partial_name: Partial or misspelled name to search for.
             limit: Maximum number of results to return.
 
         Returns:
-            List of matching PokemonData objects.
+            List of matching PokemonData objects, best match first.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT * FROM pokemon_data
-                WHERE name LIKE ?
-                ORDER BY name
-                LIMIT ?
-            """,
-                (f"%{partial_name}%", limit),
+        # The names are read on every search so writes from other connections are always seen
+        with self._connect() as conn:
+            names = [row[0] for row in conn.execute("SELECT name FROM pokemon_data ORDER BY name")]
+
+        query = utils.default_process(partial_name)
+        processed_names = [utils.default_process(name) for name in names]
+
+        matched = {i for i, processed_name in enumerate(processed_names) if query in processed_name}
+        matched.update(
+            i
+            for _name, _score, i in process.extract(
+                query, processed_names, scorer=fuzz.ratio, limit=None, score_cutoff=_NAME_SEARCH_TYPO_CUTOFF
             )
+        )
 
-            rows = cursor.fetchall()
-            return [self._row_to_pokemon_data(row=row) for row in rows]
+        ranked = process.extract(
+            query, {i: processed_names[i] for i in sorted(matched)}, scorer=fuzz.WRatio, limit=limit
+        )
+        matched_names = [names[i] for _name, _score, i in ranked]
+        pokemon_by_name = self.get_pokemon_by_names(names=matched_names)
+        return [pokemon_by_name[name.lower()] for name in matched_names if name.lower() in pokemon_by_name]
 
-    def get_all_pokemon(self, *, limit: int | None = None) -> list[PokemonData]:
+    def get_all_pokemon(self, *, limit: int | None = None, offset: int = 0) -> list[PokemonData]:
         """Get all Pokémon from the database.
 
         Args:
             limit: Optional limit on number of results.
+            offset: Number of Pokémon to skip, in id order, before collecting results.
 
         Returns:
             List of all PokemonData objects.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             if limit:
-                cursor = conn.execute("SELECT * FROM pokemon_data ORDER BY id LIMIT ?", (limit,))
+                cursor = conn.execute("SELECT * FROM pokemon_data ORDER BY id LIMIT ? OFFSET ?", (limit, offset))
+            elif offset:
+                cursor = conn.execute("SELECT * FROM pokemon_data ORDER BY id LIMIT -1 OFFSET ?", (offset,))
             else:
                 cursor = conn.execute("SELECT * FROM pokemon_data ORDER BY id")
 
             rows = cursor.fetchall()
             return [self._row_to_pokemon_data(row=row) for row in rows]
 
+    def iter_all_pokemon(self) -> Iterator[PokemonData]:
+        """Iterate over all Pokémon in the database without loading them all at once.
+
+        Yields:
+            PokemonData objects in id order.
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            for row in conn.execute("SELECT * FROM pokemon_data ORDER BY id"):
+                yield self._row_to_pokemon_data(row=row)
+
+    def get_row_count(self) -> int:
+        """Get the number of Pokémon stored in the database.
+
+        Returns:
+            Number of Pokémon in the database.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT COUNT(*) FROM pokemon_data")
+            return int(cursor.fetchone()[0])
+
     def get_database_stats(self) -> dict[str, Any]:
         """Get statistics about the database.
 
         Returns:
             Dictionary with database statistics.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             # Get total count
             cursor = conn.execute("SELECT COUNT(*) FROM pokemon_data")
             total_count = cursor.fetchone()[0]
@@ -418,6 +540,35 @@ class PokemonDatabase:
                 "database_path": str(self.config.db_path),
             }
 
+    def get_rarity_breakdown(self) -> tuple[dict[str, int], int, int]:
+        """Get Pokémon counts per rarity along with shiny and released totals.
+
+        The aggregation runs in SQLite so no rows are materialized in Python.
+
+        Returns:
+            Tuple of (counts by rarity, shiny available count, released count). Pokémon without a rarity are
+            counted under "Unknown".
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                SELECT COALESCE(NULLIF(rarity, ''), 'Unknown') AS rarity_name,
+                       COUNT(*), SUM(is_shiny_available), SUM(is_released)
+                FROM pokemon_data
+                GROUP BY rarity_name
+                """
+            )
+
+            rarity_counts: dict[str, int] = {}
+            shiny_count = 0
+            released_count = 0
+            for rarity, count, shiny, released in cursor:
+                rarity_counts[rarity] = count
+                shiny_count += shiny
+                released_count += released
+
+            return rarity_counts, shiny_count, released_count
+
     def _row_to_pokemon_data(self, *, row: sqlite3.Row) -> PokemonData:
         """Convert a database row to a PokemonData object.
 
@@ -427,8 +578,6 @@ class PokemonDatabase:
         Returns:
             PokemonData object.
         """
-        from pokemon_meetup.common.pokemon_types import PokemonType
-
         # Parse types from JSON
         types_data = json.loads(row["types_json"])
         types = []
@@ -476,12 +625,7 @@ class PokemonDatabase:
         if is_shiny_available is None and base_stardust is None:
             return False  # Nothing to update
 
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
-            # Check if Pokémon exists
-            cursor = conn.execute("SELECT 1 FROM pokemon_data WHERE id = ?", (pokemon_id,))
-            if not cursor.fetchone():
-                return False
-
+        with self._connect() as conn:
             # Build dynamic update query
             update_clauses = []
             update_values: list[bool | int] = []
@@ -504,9 +648,34 @@ class PokemonDatabase:
             set_clause = ", ".join(update_clauses)
             query = "UPDATE pokemon_data SET " + set_clause + " WHERE id = ?"  # noqa: S608
 
-            conn.execute(query, update_values)
+            # The row count tells whether the Pokémon exists, so no separate lookup is needed
+            cursor = conn.execute(query, update_values)
+            conn.commit()
+            if cursor.rowcount == 0:
+                return False
+
+        return True
+
+    def update_pokemon_fields_bulk(self, *, shiny_updates: list[tuple[int, bool]]) -> int:
+        """Update the shiny availability of several Pokémon in a single transaction.
+
+        Args:
+            shiny_updates: List of (pokemon_id, is_shiny_available) pairs.
+
+        Returns:
+            Number of Pokémon updated.
+        """
+        if not shiny_updates:
+            return 0
+
+        with self._connect() as conn:
+            cursor = conn.executemany(
+                "UPDATE pokemon_data SET is_shiny_available = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                [(is_shiny_available, pokemon_id) for pokemon_id, is_shiny_available in shiny_updates],
+            )
             conn.commit()
-            return True
+
+        return cursor.rowcount
 
     def upsert_evolution_data(self, *, evolution_data: EvolutionData) -> None:
         """Insert or update evolution data in the database.
@@ -514,7 +683,7 @@ class PokemonDatabase:
         Args:
             evolution_data: The EvolutionData object to store.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             # First, delete existing evolution data for this Pokémon
             conn.execute("DELETE FROM pokemon_evolutions WHERE from_pokemon_id = ?", (evolution_data.pokemon_id,))
 
@@ -559,7 +728,7 @@ class PokemonDatabase:
 
         pokemon_id = mega_data[0].pokemon_id
 
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             # First, delete existing mega evolution data for this Pokémon
             conn.execute("DELETE FROM mega_evolutions WHERE pokemon_id = ?", (pokemon_id,))
 
@@ -601,7 +770,7 @@ class PokemonDatabase:
         Returns:
             EvolutionData object if found, None otherwise.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             # Get the Pokémon name first
@@ -656,7 +825,7 @@ class PokemonDatabase:
         Returns:
             List of MegaEvolutionData objects.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """
@@ -708,7 +877,7 @@ class PokemonDatabase:
         Returns:
             True if any Pokémon in the evolution line can mega evolve.
         """
-        with sqlite3.connect(self.config.db_path, timeout=self.config.timeout) as conn:
+        with self._connect() as conn:
             # Check if this Pokémon can mega evolve
             cursor = conn.execute("SELECT COUNT(*) FROM mega_evolutions WHERE pokemon_id = ?", (pokemon_id,))
             if cursor.fetchone()[0] > 0:
@@ -746,3 +915,14 @@ def get_default_database() -> PokemonDatabase:
 
     config = DatabaseConfig(db_path=db_path)
     return PokemonDatabase(config=config)
+
+
+@atexit.register
+def _optimize_databases() -> None:
+    """Let SQLite refresh query planner statistics for the databases used in this process."""
+    for db_path in _optimize_on_exit:
+        try:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
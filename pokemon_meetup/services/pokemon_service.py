@@ -8,6 +8,9 @@ integrating the database storage with the API client. It handles:
 - Providing user prompts for data management decisions
 """
 
+import asyncio
+from collections.abc import Iterator
+from functools import cache
 from typing import Literal
 
 from pokemon_meetup.database.models import PokemonDatabase, get_default_database
@@ -32,7 +35,12 @@ class PokemonService:
         self.database = database or get_default_database()
 
     async def get_pokemon_data(
-        self, *, name: str, force_refresh: bool = False, interactive: bool = True
+        self,
+        *,
+        name: str,
+        force_refresh: bool = False,
+        interactive: bool = True,
+        prefetched: PokemonData | None = None,
     ) -> PokemonData | None:
         """Get Pokémon data, checking database first and optionally prompting user.
 
@@ -40,12 +48,13 @@ class PokemonService:
             name: Pokémon name to fetch.
             force_refresh: If True, always fetch from API regardless of database.
             interactive: If True, prompt user when data exists in database.
+            prefetched: Database record already loaded by the caller, used instead of looking it up again.
 
         Returns:
             PokemonData object if found, None otherwise.
         """
         # First, try to get data from database
-        existing_data = self.database.get_pokemon_by_name(name=name)
+        existing_data = prefetched or self.database.get_pokemon_by_name(name=name)
 
         if existing_data and not force_refresh:
             if interactive:
@@ -69,6 +78,9 @@ class PokemonService:
         # Fetch fresh data from API (either no existing data or user chose fresh)
         if not existing_data:
             print(f"🔍 {name} not found in database, fetching from API...")
+        else:
+            # The API client shares its data across instances, so drop it to really refresh
+            PoGoAPIClient.clear_caches()
 
         async with PoGoAPIClient() as client:
             fresh_data = await client.get_pokemon_data(name=name)
@@ -100,12 +112,28 @@ class PokemonService:
         Returns:
             List of matching Pokémon names.
         """
-        results = []
+        matches = await self.search_pokemon_with_data(partial_name=partial_name, limit=limit, source=source)
+        return [name for name, _pokemon_data in matches]
+
+    async def search_pokemon_with_data(
+        self, *, partial_name: str, limit: int = 5, source: Literal["database", "api", "both"] = "both"
+    ) -> list[tuple[str, PokemonData | None]]:
+        """Search for Pokémon names, keeping the stored data of the database matches.
+
+        Args:
+            partial_name: Partial name to search for.
+            limit: Maximum number of results.
+            source: Where to search - database, API, or both.
+
+        Returns:
+            List of (name, pokemon_data) pairs, where pokemon_data is None for names only found through the API.
+        """
+        results: dict[str, PokemonData | None] = {}
 
         if source in ["database", "both"]:
             # Search in database first
             db_results = self.database.search_pokemon_by_name(partial_name=partial_name, limit=limit)
-            results.extend([pokemon.name for pokemon in db_results])
+            results.update((pokemon.name, pokemon) for pokemon in db_results)
 
         if source in ["api", "both"] and len(results) < limit:
             # Search via API if we need more results
@@ -115,11 +143,11 @@ class PokemonService:
             # Add API results that aren't already in our list
             for name in api_results:
                 if name not in results:
-                    results.append(name)
+                    results[name] = None
                     if len(results) >= limit:
                         break
 
-        return results[:limit]
+        return list(results.items())[:limit]
 
     def get_database_stats(self) -> dict[str, object]:
         """Get database statistics.
@@ -129,16 +157,33 @@ class PokemonService:
         """
         return self.database.get_database_stats()
 
-    def list_cached_pokemon(self, *, limit: int | None = None) -> list[PokemonData]:
+    def get_rarity_breakdown(self) -> tuple[dict[str, int], int, int]:
+        """Get Pokémon counts per rarity along with shiny and released totals.
+
+        Returns:
+            Tuple of (counts by rarity, shiny available count, released count).
+        """
+        return self.database.get_rarity_breakdown()
+
+    def list_cached_pokemon(self, *, limit: int | None = None, offset: int = 0) -> list[PokemonData]:
         """List Pokémon stored in the database.
 
         Args:
             limit: Optional limit on number of results.
+            offset: Number of Pokémon to skip before collecting results.
 
         Returns:
             List of PokemonData objects from database.
         """
-        return self.database.get_all_pokemon(limit=limit)
+        return self.database.get_all_pokemon(limit=limit, offset=offset)
+
+    def iter_cached_pokemon(self) -> Iterator[PokemonData]:
+        """Iterate over the Pokémon stored in the database one at a time.
+
+        Returns:
+            Iterator of PokemonData objects from database.
+        """
+        return self.database.iter_all_pokemon()
 
     def _get_last_updated_display(self, pokemon_data: PokemonData) -> str:
         """Get a human-readable display of when data was last updated.
@@ -209,6 +254,25 @@ class PokemonService:
 
         return updated
 
+    def update_pokemon_fields_bulk(self, *, shiny_updates: list[tuple[PokemonData, bool]]) -> int:
+        """Update the shiny availability of several Pokémon in the database at once.
+
+        Args:
+            shiny_updates: List of (PokemonData, is_shiny_available) pairs.
+
+        Returns:
+            Number of Pokémon updated.
+        """
+        updated = self.database.update_pokemon_fields_bulk(
+            shiny_updates=[(pokemon_data.id, is_shiny_available) for pokemon_data, is_shiny_available in shiny_updates]
+        )
+
+        # Update the in-memory objects as well
+        for pokemon_data, is_shiny_available in shiny_updates:
+            pokemon_data.is_shiny_available = is_shiny_available
+
+        return updated
+
     async def get_evolution_data(self, *, pokemon_id: int, force_refresh: bool = False) -> EvolutionData | None:
         """Get evolution data for a Pokémon, checking database first.
 
@@ -307,7 +371,12 @@ class PokemonService:
             return has_mega
 
     async def get_pokemon_with_evolution_info(
-        self, *, name: str, force_refresh: bool = False, interactive: bool = True
+        self,
+        *,
+        name: str,
+        force_refresh: bool = False,
+        interactive: bool = True,
+        prefetched: PokemonData | None = None,
     ) -> tuple[PokemonData | None, EvolutionData | None, list[MegaEvolutionData], bool]:
         """Get comprehensive Pokémon data including evolution and mega evolution info.
 
@@ -315,34 +384,50 @@ class PokemonService:
             name: Pokémon name to fetch.
             force_refresh: If True, always fetch from API.
             interactive: If True, prompt user when data exists in database.
+            prefetched: Pokémon data already loaded by the caller, used instead of looking it up again.
 
         Returns:
             Tuple of (PokemonData, EvolutionData, MegaEvolutionData list, has_mega_in_line).
         """
         # Get basic Pokémon data
-        pokemon_data = await self.get_pokemon_data(name=name, force_refresh=force_refresh, interactive=interactive)
+        pokemon_data = await self.get_pokemon_data(
+            name=name, force_refresh=force_refresh, interactive=interactive, prefetched=prefetched
+        )
 
         if not pokemon_data:
             return None, None, [], False
 
-        # Get evolution data
-        evolution_data = await self.get_evolution_data(pokemon_id=pokemon_data.id, force_refresh=force_refresh)
-
-        # Get mega evolution data
-        mega_data = await self.get_mega_evolution_data(pokemon_id=pokemon_data.id, force_refresh=force_refresh)
-
-        # Check if evolution line has mega
-        has_mega_in_line = await self.check_evolution_line_has_mega(
-            pokemon_id=pokemon_data.id, force_refresh=force_refresh
+        # Evolution, mega evolution and mega-in-line lookups only need the ID, so run them concurrently
+        evolution_data, mega_data, has_mega_in_line = await asyncio.gather(
+            self.get_evolution_data(pokemon_id=pokemon_data.id, force_refresh=force_refresh),
+            self.get_mega_evolution_data(pokemon_id=pokemon_data.id, force_refresh=force_refresh),
+            self.check_evolution_line_has_mega(pokemon_id=pokemon_data.id, force_refresh=force_refresh),
         )
 
         return pokemon_data, evolution_data, mega_data, has_mega_in_line
 
 
+@cache
+def _get_default_service() -> PokemonService:
+    """Get the service backed by the default database, creating it on first use.
+
+    Returns:
+        Shared PokemonService instance.
+    """
+    return PokemonService()
+
+
 def get_pokemon_service(*, database: PokemonDatabase | None = None) -> PokemonService:
     """Get the default Pokémon service instance.
 
+    The default service is shared, so scripts run from the same process reuse its database and caches.
+
+    Args:
+        database: Database instance to use. If given, a new service using it is returned instead.
+
     Returns:
         PokemonService instance with default configuration.
     """
-    return PokemonService(database=database)
+    if database is not None:
+        return PokemonService(database=database)
+    return _get_default_service()
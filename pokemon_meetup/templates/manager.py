@@ -5,10 +5,11 @@ variables using Python's string.Template class. Templates are stored in the
 templates/ directory and use $variable syntax for substitution.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 
-from pokemon_meetup.common.pokemon_types import get_type_emoji, get_type_spanish_name
+from pokemon_meetup.common.pokemon_types import PokemonType, get_type_emoji, get_type_spanish_name
 from pokemon_meetup.common.weather import WeatherBoosts
 from pokemon_meetup.utils.date_utils import (
     get_dynamax_monday_date,
@@ -22,6 +23,31 @@ from pokemon_meetup.utils.date_utils import (
 from pokemon_meetup.web.pokemon_api import EvolutionData, MegaEvolutionData, PokemonData
 
 
+@lru_cache(maxsize=256)
+def _format_types(types: tuple[PokemonType, ...]) -> str:
+    """Format a combination of types with Spanish names and emojis.
+
+    Args:
+        types: The Pokémon's types, in order.
+
+    Returns:
+        Formatted string with type names and emojis in Spanish.
+    """
+    if not types:
+        return "Tipo desconocido"
+
+    type_strings = []
+    for pokemon_type in types:
+        spanish_name = get_type_spanish_name(pokemon_type=pokemon_type)
+        emoji = get_type_emoji(pokemon_type=pokemon_type)
+        type_strings.append(f"{spanish_name} {emoji}")
+
+    if len(type_strings) == 1:
+        return type_strings[0]
+    else:
+        return " / ".join(type_strings)
+
+
 class TemplateManager:
     """Manager for loading and processing text templates."""
 
@@ -410,19 +436,8 @@ class TemplateManager:
         Returns:
             Formatted string with type names and emojis in Spanish.
         """
-        if not pokemon_data.types:
-            return "Tipo desconocido"
-
-        type_strings = []
-        for pokemon_type in pokemon_data.types:
-            spanish_name = get_type_spanish_name(pokemon_type=pokemon_type)
-            emoji = get_type_emoji(pokemon_type=pokemon_type)
-            type_strings.append(f"{spanish_name} {emoji}")
-
-        if len(type_strings) == 1:
-            return type_strings[0]
-        else:
-            return " / ".join(type_strings)
+        # The text only depends on the types, so Pokémon sharing a typing share the cached entry
+        return _format_types(tuple(pokemon_data.types))
 
     def _format_shiny_text(self, *, is_available: bool, event_type: str) -> str:
         """Format shiny availability text based on availability and event type.
@@ -510,7 +525,7 @@ class TemplateManager:
             Formatted stardust details in Spanish.
         """
         doubled_stardust = base_stardust * 2
-        star_piece_stardust = int(doubled_stardust * 1.5)
+        star_piece_stardust = doubled_stardust * 3 // 2  # Star Piece adds 50%, exact in integer math
 
         return f"Polvos estelares: cada captura otorgará {doubled_stardust}, {star_piece_stardust} con estrella. ⭐️"
 
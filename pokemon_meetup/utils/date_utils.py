@@ -2,10 +2,184 @@
 
 This module provides functions for calculating event dates, particularly
 for finding the current or next Monday for Dynamax Monday events.
+
+All calculations are backed by `SpanishDateFormatter`, which anchors every
+lookup to a single reference date and memoizes the formatted results. The
+module-level functions are thin wrappers kept for convenience; the ones
+returning formatted event dates share one formatter per reference day, so
+repeated calls during a run reuse its memoized results.
 """
 
-from datetime import datetime, timedelta
-from typing import Literal
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import ClassVar, Literal
+
+
+class SpanishDateFormatter:
+    """Formatter for event dates in Spanish, anchored to a fixed reference date."""
+
+    # Spanish month names, indexed by month - 1
+    _MONTHS: ClassVar[tuple[str, ...]] = (
+        "enero",
+        "febrero",
+        "marzo",
+        "abril",
+        "mayo",
+        "junio",
+        "julio",
+        "agosto",
+        "septiembre",
+        "octubre",
+        "noviembre",
+        "diciembre",
+    )
+
+    # Spanish day names, indexed by weekday (0=Monday)
+    _DAYS: ClassVar[tuple[str, ...]] = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+
+    # Offsets for every possible distance to the next weekday
+    _DELTAS: ClassVar[tuple[timedelta, ...]] = tuple(timedelta(days=days) for days in range(7))
+
+    def __init__(self, *, now: datetime | None = None) -> None:
+        """Initialize the formatter.
+
+        Args:
+            now: Reference date for all calculations. If None, uses current date.
+        """
+        self._now = now if now is not None else datetime.now()
+        self._cache: dict[tuple[int, str], str] = {}
+
+    @property
+    def now(self) -> datetime:
+        """Reference date used for all calculations."""
+        return self._now
+
+    def next_day_of_week(self, *, weekday: int) -> datetime:
+        """Get the date of the current or next specified day of the week.
+
+        Args:
+            weekday: Day of week (0=Monday, 1=Tuesday, ..., 6=Sunday).
+
+        Returns:
+            DateTime object representing the current or next specified day.
+        """
+        # If today is the specified day the offset is zero, so today is returned
+        return self._now + self._DELTAS[(weekday - self._now.weekday()) % 7]
+
+    def format(self, *, date: datetime, format_type: Literal["full", "short"] = "full") -> str:
+        """Format a date in Spanish.
+
+        Args:
+            date: DateTime object to format.
+            format_type: Type of formatting - "full" or "short".
+
+        Returns:
+            Formatted date string in Spanish.
+        """
+        month_name = self._MONTHS[date.month - 1]
+
+        if format_type == "full":
+            return f"{self._DAYS[date.weekday()]} {date.day} de {month_name}"
+        else:  # short
+            return f"{date.day} de {month_name}"
+
+    def event_date(self, *, weekday: int, format_type: Literal["full", "short"] = "full") -> str:
+        """Get the formatted date for the current or next occurrence of a weekday.
+
+        Args:
+            weekday: Day of week (0=Monday, 1=Tuesday, ..., 6=Sunday).
+            format_type: Type of formatting - "full" or "short".
+
+        Returns:
+            Formatted Spanish date string for the event.
+        """
+        key = (weekday, format_type)
+        formatted = self._cache.get(key)
+        if formatted is None:
+            formatted = self.format(date=self.next_day_of_week(weekday=weekday), format_type=format_type)
+            self._cache[key] = formatted
+        return formatted
+
+    def dynamax_monday(self) -> str:
+        """Get the formatted date for the next Dynamax Monday event."""
+        return self.event_date(weekday=0)
+
+    def spotlight_tuesday(self) -> str:
+        """Get the formatted date for the next Spotlight Hour Tuesday event."""
+        return self.event_date(weekday=1)
+
+    def legendary_wednesday(self) -> str:
+        """Get the formatted date for the next Legendary Hour Wednesday event."""
+        return self.event_date(weekday=2)
+
+    def weekend_event(self, *, day_choice: int) -> str:
+        """Get the formatted date for the next weekend event.
+
+        Args:
+            day_choice: 1 for Saturday, 2 for Sunday.
+
+        Returns:
+            Formatted Spanish date string for the weekend event.
+        """
+        if day_choice not in (1, 2):
+            raise ValueError("day_choice must be 1 (Saturday) or 2 (Sunday)")
+
+        return self.event_date(weekday=day_choice + 4)
+
+    def legendary_hour(self, *, day_choice: int) -> str:
+        """Get the formatted date for the next Legendary Hour event on the specified day.
+
+        Args:
+            day_choice: Day choice (1=Monday, 2=Tuesday, etc.).
+
+        Returns:
+            Formatted Spanish date string for the Legendary Hour event.
+        """
+        # Convert day_choice to 0-based weekday index
+        return self.event_date(weekday=day_choice - 1)
+
+    def week_info(self) -> dict[str, str | bool | int]:
+        """Get information about the current week for event planning.
+
+        Returns:
+            Dictionary with week information including next Monday date.
+        """
+        next_monday = self.next_day_of_week(weekday=0)
+
+        return {
+            "next_monday_date": self.event_date(weekday=0, format_type="full"),
+            "next_monday_short": self.event_date(weekday=0, format_type="short"),
+            "is_today_monday": self._now.weekday() == 0,
+            "days_until_monday": (next_monday - self._now).days,
+            "current_date": self.format(date=self._now, format_type="full"),
+        }
+
+
+@lru_cache(maxsize=8)
+def _get_day_formatter(day: date) -> SpanishDateFormatter:
+    """Get the formatter shared by the event date wrappers for a reference day.
+
+    Args:
+        day: Reference day.
+
+    Returns:
+        SpanishDateFormatter anchored to the start of the day.
+    """
+    return SpanishDateFormatter(now=datetime.combine(day, time()))
+
+
+def _shared_formatter(*, from_date: datetime | None) -> SpanishDateFormatter:
+    """Get the shared formatter for the day of a reference date.
+
+    Formatted event dates only depend on the day, so any time of that day gives the same results.
+
+    Args:
+        from_date: Date to calculate from. If None, uses current date.
+
+    Returns:
+        SpanishDateFormatter shared by every call for the same day.
+    """
+    return _get_day_formatter((from_date if from_date is not None else datetime.now()).date())
 
 
 def get_next_monday(*, from_date: datetime | None = None) -> datetime:
@@ -17,17 +191,7 @@ def get_next_monday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Monday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Monday is weekday 0 in Python
-    days_until_monday = (7 - from_date.weekday()) % 7
-
-    # If today is Monday, return today; otherwise return next Monday
-    if from_date.weekday() == 0:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_monday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=0)
 
 
 def format_spanish_date(*, date: datetime, format_type: Literal["full", "short"] = "full") -> str:
@@ -40,32 +204,7 @@ def format_spanish_date(*, date: datetime, format_type: Literal["full", "short"]
     Returns:
         Formatted date string in Spanish.
     """
-    # Spanish month names
-    spanish_months = {
-        1: "enero",
-        2: "febrero",
-        3: "marzo",
-        4: "abril",
-        5: "mayo",
-        6: "junio",
-        7: "julio",
-        8: "agosto",
-        9: "septiembre",
-        10: "octubre",
-        11: "noviembre",
-        12: "diciembre",
-    }
-
-    # Spanish day names
-    spanish_days = {0: "lunes", 1: "martes", 2: "miércoles", 3: "jueves", 4: "viernes", 5: "sábado", 6: "domingo"}
-
-    day_name = spanish_days[date.weekday()]
-    month_name = spanish_months[date.month]
-
-    if format_type == "full":
-        return f"{day_name} {date.day} de {month_name}"
-    else:  # short
-        return f"{date.day} de {month_name}"
+    return SpanishDateFormatter(now=date).format(date=date, format_type=format_type)
 
 
 def get_dynamax_monday_date(*, from_date: datetime | None = None) -> str:
@@ -77,8 +216,7 @@ def get_dynamax_monday_date(*, from_date: datetime | None = None) -> str:
     Returns:
         Formatted Spanish date string for the Dynamax Monday event.
     """
-    monday_date = get_next_monday(from_date=from_date)
-    return format_spanish_date(date=monday_date, format_type="full")
+    return _shared_formatter(from_date=from_date).dynamax_monday()
 
 
 def get_current_week_info(*, from_date: datetime | None = None) -> dict[str, str | bool | int]:
@@ -90,18 +228,7 @@ def get_current_week_info(*, from_date: datetime | None = None) -> dict[str, str
     Returns:
         Dictionary with week information including next Monday date.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    next_monday = get_next_monday(from_date=from_date)
-
-    return {
-        "next_monday_date": format_spanish_date(date=next_monday, format_type="full"),
-        "next_monday_short": format_spanish_date(date=next_monday, format_type="short"),
-        "is_today_monday": from_date.weekday() == 0,
-        "days_until_monday": (next_monday - from_date).days,
-        "current_date": format_spanish_date(date=from_date, format_type="full"),
-    }
+    return _shared_formatter(from_date=from_date).week_info()
 
 
 def get_next_tuesday(*, from_date: datetime | None = None) -> datetime:
@@ -113,17 +240,7 @@ def get_next_tuesday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Tuesday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Tuesday is weekday 1 in Python
-    days_until_tuesday = (1 - from_date.weekday()) % 7
-
-    # If today is Tuesday, return today; otherwise return next Tuesday
-    if from_date.weekday() == 1:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_tuesday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=1)
 
 
 def get_spotlight_tuesday_date(*, from_date: datetime | None = None) -> str:
@@ -135,8 +252,7 @@ def get_spotlight_tuesday_date(*, from_date: datetime | None = None) -> str:
     Returns:
         Formatted Spanish date string for the Spotlight Hour Tuesday event.
     """
-    tuesday_date = get_next_tuesday(from_date=from_date)
-    return format_spanish_date(date=tuesday_date, format_type="full")
+    return _shared_formatter(from_date=from_date).spotlight_tuesday()
 
 
 def get_next_wednesday(*, from_date: datetime | None = None) -> datetime:
@@ -148,17 +264,7 @@ def get_next_wednesday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Wednesday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Wednesday is weekday 2 in Python
-    days_until_wednesday = (2 - from_date.weekday()) % 7
-
-    # If today is Wednesday, return today; otherwise return next Wednesday
-    if from_date.weekday() == 2:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_wednesday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=2)
 
 
 def get_legendary_wednesday_date(*, from_date: datetime | None = None) -> str:
@@ -170,8 +276,7 @@ def get_legendary_wednesday_date(*, from_date: datetime | None = None) -> str:
     Returns:
         Formatted Spanish date string for the Legendary Hour Wednesday event.
     """
-    wednesday_date = get_next_wednesday(from_date=from_date)
-    return format_spanish_date(date=wednesday_date, format_type="full")
+    return _shared_formatter(from_date=from_date).legendary_wednesday()
 
 
 def get_next_saturday(*, from_date: datetime | None = None) -> datetime:
@@ -183,17 +288,7 @@ def get_next_saturday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Saturday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Saturday is weekday 5 in Python
-    days_until_saturday = (5 - from_date.weekday()) % 7
-
-    # If today is Saturday, return today; otherwise return next Saturday
-    if from_date.weekday() == 5:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_saturday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=5)
 
 
 def get_next_sunday(*, from_date: datetime | None = None) -> datetime:
@@ -205,17 +300,7 @@ def get_next_sunday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Sunday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Sunday is weekday 6 in Python
-    days_until_sunday = (6 - from_date.weekday()) % 7
-
-    # If today is Sunday, return today; otherwise return next Sunday
-    if from_date.weekday() == 6:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_sunday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=6)
 
 
 def get_weekend_event_date(*, day_choice: int, from_date: datetime | None = None) -> str:
@@ -228,14 +313,7 @@ def get_weekend_event_date(*, day_choice: int, from_date: datetime | None = None
     Returns:
         Formatted Spanish date string for the weekend event.
     """
-    if day_choice == 1:
-        event_date = get_next_saturday(from_date=from_date)
-    elif day_choice == 2:
-        event_date = get_next_sunday(from_date=from_date)
-    else:
-        raise ValueError("day_choice must be 1 (Saturday) or 2 (Sunday)")
-
-    return format_spanish_date(date=event_date, format_type="full")
+    return _shared_formatter(from_date=from_date).weekend_event(day_choice=day_choice)
 
 
 def get_max_battle_day_date(*, day_choice: int, from_date: datetime | None = None) -> str:
@@ -273,17 +351,7 @@ def get_next_thursday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Thursday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Thursday is weekday 3 in Python
-    days_until_thursday = (3 - from_date.weekday()) % 7
-
-    # If today is Thursday, return today; otherwise return next Thursday
-    if from_date.weekday() == 3:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_thursday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=3)
 
 
 def get_next_friday(*, from_date: datetime | None = None) -> datetime:
@@ -295,17 +363,7 @@ def get_next_friday(*, from_date: datetime | None = None) -> datetime:
     Returns:
         DateTime object representing the current or next Friday.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    # Friday is weekday 4 in Python
-    days_until_friday = (4 - from_date.weekday()) % 7
-
-    # If today is Friday, return today; otherwise return next Friday
-    if from_date.weekday() == 4:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_friday)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=4)
 
 
 def get_next_day_of_week(*, weekday: int, from_date: datetime | None = None) -> datetime:
@@ -318,16 +376,7 @@ def get_next_day_of_week(*, weekday: int, from_date: datetime | None = None) ->
     Returns:
         DateTime object representing the current or next specified day.
     """
-    if from_date is None:
-        from_date = datetime.now()
-
-    days_until_day = (weekday - from_date.weekday()) % 7
-
-    # If today is the specified day, return today; otherwise return next occurrence
-    if from_date.weekday() == weekday:
-        return from_date
-    else:
-        return from_date + timedelta(days=days_until_day)
+    return SpanishDateFormatter(now=from_date).next_day_of_week(weekday=weekday)
 
 
 def get_legendary_hour_date(*, day_choice: int, from_date: datetime | None = None) -> str:
@@ -340,7 +389,4 @@ def get_legendary_hour_date(*, day_choice: int, from_date: datetime | None = Non
     Returns:
         Formatted Spanish date string for the Legendary Hour event.
     """
-    # Convert day_choice to 0-based weekday index
-    weekday = day_choice - 1
-    event_date = get_next_day_of_week(weekday=weekday, from_date=from_date)
-    return format_spanish_date(date=event_date, format_type="full")
+    return _shared_formatter(from_date=from_date).legendary_hour(day_choice=day_choice)
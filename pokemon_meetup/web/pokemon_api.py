@@ -1,15 +1,38 @@
 """Pokémon Go API client for fetching Pokémon data from PoGoAPI.net."""
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any, Self
+import atexit
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Self
+from weakref import WeakKeyDictionary
 
 import httpx
+import orjson
 
 from pokemon_meetup.common.pokemon_types import PokemonType
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Raw API responses are persisted here and revalidated with ETag/Last-Modified
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "api_cache"
+
+# Response bodies are read in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# PoGo API type names (lowercased) mapped to their enum members
+_TYPE_BY_LOWER: dict[str, PokemonType] = {pokemon_type.value.lower(): pokemon_type for pokemon_type in PokemonType}
+
+# Levels reported in PokemonData.cp_level_* fields
+CP_LEVELS: tuple[float, ...] = (20.0, 25.0, 30.0, 40.0)
+
+
+@dataclass(slots=True)
 class EvolutionRequirement:
     """Requirements for a Pokémon evolution."""
 
@@ -27,22 +50,17 @@ class EvolutionRequirement:
     gender_required: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionData:
     """Evolution data for a Pokémon."""
 
     pokemon_id: int
     pokemon_name: str
     form: str | None = None
-    evolutions: list[EvolutionRequirement] | None = None
+    evolutions: list[EvolutionRequirement] = field(default_factory=list)
 
-    def __post_init__(self) -> None:
-        """Initialize evolutions list if None."""
-        if self.evolutions is None:
-            self.evolutions = []
 
-
-@dataclass
+@dataclass(slots=True)
 class MegaEvolutionData:
     """Mega evolution data for a Pokémon."""
 
@@ -59,7 +77,7 @@ class MegaEvolutionData:
     cp_multiplier_override: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonData:
     """Data structure for Pokémon Go information."""
 
@@ -84,27 +102,86 @@ class PokemonData:
     base_stardust: int | None = None
 
 
+@dataclass
+class _APICaches:
+    """Parsed API data shared by every PoGoAPIClient in the process.
+
+    A cache stays None until its endpoint has answered, so a failed request is retried by the next lookup
+    instead of leaving the endpoint empty for the rest of the process.
+    """
+
+    pokemon_stats: dict[int, Any] | None = None
+    pokemon_names: dict[int, Any] | None = None
+    pokemon_types: dict[int, Any] | None = None
+    pokemon_max_cp: dict[int, Any] | None = None
+    shiny_pokemon: dict[int, bool] | None = None
+    released_pokemon: dict[int, bool] | None = None
+    buddy_distances: dict[int, int] | None = None
+    candy_to_evolve: dict[int, int] | None = None
+    pokemon_rarity: dict[int, str] | None = None
+    cp_multiplier: dict[float, float] | None = None
+    pokemon_evolutions: dict[int, Any] | None = None
+    mega_pokemon: dict[int, list[Any]] | None = None
+
+    # Name indexes built alongside the names cache for case-insensitive lookups
+    pokemon_names_by_lower: dict[str, tuple[int, str]] = field(default_factory=dict)
+    pokemon_names_lower: list[tuple[str, str]] = field(default_factory=list)
+
+    # Evolution-line indexes built alongside the evolutions and mega caches
+    evolution_children: dict[int, tuple[int, ...]] = field(default_factory=dict)
+    mega_ids: frozenset[int] = frozenset()
+
+    # One lock per cache and event loop so concurrent callers don't fetch the same endpoint twice. asyncio locks
+    # can't be shared between loops, and the sync wrappers run on their own background loop.
+    _locks: WeakKeyDictionary[asyncio.AbstractEventLoop, defaultdict[str, asyncio.Lock]] = field(
+        default_factory=WeakKeyDictionary
+    )
+    _locks_guard: threading.Lock = field(default_factory=threading.Lock)
+
+    def lock(self, name: str) -> asyncio.Lock:
+        """Get the lock guarding one cache on the running event loop.
+
+        Args:
+            name: Name of the cache the lock guards.
+
+        Returns:
+            Lock for that cache, created on first use by the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._locks_guard:
+            loop_locks = self._locks.get(loop)
+            if loop_locks is None:
+                loop_locks = self._locks[loop] = defaultdict(asyncio.Lock)
+            return loop_locks[name]
+
+
 class PoGoAPIClient:
     """Client for fetching Pokémon data from PoGoAPI.net."""
 
-    def __init__(self) -> None:
-        """Initialize the API client."""
+    # Shared across instances so short-lived clients don't re-fetch and re-parse every endpoint
+    _caches: ClassVar[_APICaches] = _APICaches()
+
+    def __init__(self, *, cache_dir: Path | None = None, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Initialize the API client.
+
+        Args:
+            cache_dir: Directory for persisted API responses. If None, uses default.
+            transport: HTTP transport to send requests through. If None, httpx's default is used.
+        """
         self.base_url: str = "https://pogoapi.net/api/v1"
-        self.client: httpx.AsyncClient = httpx.AsyncClient(timeout=30.0)
-
-        # Cache for API data to reduce requests
-        self._pokemon_stats_cache: dict[int, Any] | None = None
-        self._pokemon_names_cache: dict[int, Any] | None = None
-        self._pokemon_types_cache: dict[int, Any] | None = None
-        self._pokemon_max_cp_cache: dict[int, Any] | None = None
-        self._shiny_pokemon_cache: dict[int, bool] | None = None
-        self._released_pokemon_cache: dict[int, bool] | None = None
-        self._buddy_distances_cache: dict[int, int] | None = None
-        self._candy_to_evolve_cache: dict[int, int] | None = None
-        self._pokemon_rarity_cache: dict[int, str] | None = None
-        self._cp_multiplier_cache: list[Any] | None = None
-        self._pokemon_evolutions_cache: dict[int, Any] | None = None
-        self._mega_pokemon_cache: dict[int, list[Any]] | None = None
+        self.cache_dir: Path = cache_dir or DEFAULT_CACHE_DIR
+        # Every endpoint lives on the same host, so multiplex them over one HTTP/2 connection
+        self.client: httpx.AsyncClient = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+            transport=transport,
+        )
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop the shared API data so the next lookups fetch every endpoint again."""
+        cls._caches = _APICaches()
 
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
@@ -116,238 +193,354 @@ class PoGoAPIClient:
         """Async context manager exit."""
         await self.client.aclose()
 
-    async def _fetch_json(self, *, endpoint: str) -> dict[str, Any] | list[Any] | None:
+    async def _fetch_json(self, *, endpoint: str, revalidate: bool = True) -> dict[str, Any] | list[Any] | None:
         """Fetch JSON data from a PoGo API endpoint.
 
+        Responses are persisted to the cache directory. When a cached copy exists the
+        request is made conditional, so an unchanged endpoint answers 304 without a body.
+
         Args:
             endpoint: The API endpoint to fetch from.
+            revalidate: If False, ignore the cached copy and request the full body.
 
         Returns:
             JSON data or None if request fails.
         """
+        body_path = self.cache_dir / endpoint
+        meta_path = self.cache_dir / f"{endpoint}.meta"
+        headers = self._get_conditional_headers(body_path, meta_path) if revalidate else {}
+
         try:
-            response = await self.client.get(f"{self.base_url}/{endpoint}")
-            response.raise_for_status()
-            json_data: dict[str, Any] | list[Any] = response.json()
-            return json_data
-        except (httpx.HTTPError, ValueError) as e:
-            print(f"Error fetching {endpoint}: {e}")
+            async with self.client.stream("GET", f"{self.base_url}/{endpoint}", headers=headers) as response:
+                # A 304 only counts as an answer to a conditional request; otherwise raise_for_status rejects it
+                if response.status_code == httpx.codes.NOT_MODIFIED and headers:
+                    cached_data = _load_cached_body(body_path=body_path)
+                    if cached_data is not None:
+                        return cached_data
+
+                    # The validators outlived the body they describe, so drop them and download it again
+                    logger.warning("Cached copy of %s is unreadable, fetching it again", endpoint)
+                    with suppress(OSError):
+                        meta_path.unlink(missing_ok=True)
+                    refetch = True
+                else:
+                    refetch = False
+                    response.raise_for_status()
+
+                    # Drain the body as it arrives instead of waiting for httpx to buffer it
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        body += chunk
+
+            if refetch:
+                return await self._fetch_json(endpoint=endpoint, revalidate=False)
+
+            json_data: dict[str, Any] | list[Any] = orjson.loads(body)
+        except (httpx.HTTPError, ValueError, OSError) as e:
+            logger.warning("Error fetching %s: %s", endpoint, e)
             return None
 
+        self._store_response(response, bytes(body), body_path, meta_path)
+        return json_data
+
+    def _get_conditional_headers(self, body_path: Path, meta_path: Path) -> dict[str, str]:
+        """Build revalidation headers from the metadata of a cached response.
+
+        Args:
+            body_path: Path of the cached response body.
+            meta_path: Path of the cached response metadata.
+
+        Returns:
+            Dictionary of conditional request headers (empty if nothing is cached).
+        """
+        if not body_path.exists() or not meta_path.exists():
+            return {}
+
+        try:
+            meta: dict[str, str] = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if "etag" in meta:
+            headers["If-None-Match"] = meta["etag"]
+        if "last-modified" in meta:
+            headers["If-Modified-Since"] = meta["last-modified"]
+        return headers
+
+    def _store_response(self, response: httpx.Response, body: bytes, body_path: Path, meta_path: Path) -> None:
+        """Persist a response body and its validators to the cache directory.
+
+        Args:
+            response: Successful response whose validators are persisted.
+            body: Raw response body.
+            body_path: Path of the cached response body.
+            meta_path: Path of the cached response metadata.
+        """
+        meta = {key: response.headers[key] for key in ("etag", "last-modified") if key in response.headers}
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomically(path=body_path, data=body)
+            _write_atomically(path=meta_path, data=json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning("Error caching %s: %s", body_path.name, e)
+
     async def _get_pokemon_stats(self) -> dict[int, Any]:
         """Get cached Pokemon stats data."""
-        if self._pokemon_stats_cache is None:
-            stats_data = await self._fetch_json(endpoint="pokemon_stats.json")
-            if stats_data and isinstance(stats_data, list):
-                # Convert list to dict for easier lookup by ID
-                # Handle multiple forms by preferring "Normal" form
-                self._pokemon_stats_cache = {}
-                for pokemon in stats_data:
-                    if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                        pokemon_id = pokemon["pokemon_id"]
-                        # Prefer Normal form, but use any form if Normal not available
-                        if pokemon_id not in self._pokemon_stats_cache or pokemon.get("form", "Normal") == "Normal":
-                            self._pokemon_stats_cache[pokemon_id] = pokemon
-            else:
-                self._pokemon_stats_cache = {}
-        return self._pokemon_stats_cache
+        async with self._caches.lock("pokemon_stats"):
+            if self._caches.pokemon_stats is None:
+                stats_data = await self._fetch_json(endpoint="pokemon_stats.json")
+                if stats_data is None:
+                    return {}
+                pokemon_stats: dict[int, Any] = {}
+                if isinstance(stats_data, list):
+                    with suppress(KeyError, TypeError, AttributeError):
+                        pokemon_stats = _index_preferring_normal_form(stats_data)
+                self._caches.pokemon_stats = pokemon_stats
+        return self._caches.pokemon_stats
 
     async def _get_pokemon_names(self) -> dict[int, Any]:
         """Get cached Pokemon names data."""
-        if self._pokemon_names_cache is None:
-            names_data = await self._fetch_json(endpoint="pokemon_names.json")
-            if names_data and isinstance(names_data, dict):
-                # Convert string keys to int keys
-                self._pokemon_names_cache = {}
-                for k, v in names_data.items():
-                    if isinstance(k, str) and k.isdigit():
-                        self._pokemon_names_cache[int(k)] = v
-            else:
-                self._pokemon_names_cache = {}
-        return self._pokemon_names_cache
+        async with self._caches.lock("pokemon_names"):
+            if self._caches.pokemon_names is None:
+                names_data = await self._fetch_json(endpoint="pokemon_names.json")
+                if names_data is None:
+                    return {}
+                pokemon_names: dict[int, Any] = {}
+                names_by_lower: dict[str, tuple[int, str]] = {}
+                names_lower: list[tuple[str, str]] = []
+                if isinstance(names_data, dict):
+                    with suppress(KeyError, TypeError, ValueError, AttributeError):
+                        # Convert string keys to int keys
+                        pokemon_names = {int(k): v for k, v in names_data.items()}
+
+                        # Lowercase every name once so lookups and searches don't have to
+                        for pokemon_id, pokemon_data in pokemon_names.items():
+                            name = pokemon_data["name"]
+                            names_by_lower.setdefault(name.lower(), (pokemon_id, name))
+                            names_lower.append((name.lower(), name))
+                self._caches.pokemon_names_by_lower = names_by_lower
+                self._caches.pokemon_names_lower = names_lower
+                self._caches.pokemon_names = pokemon_names
+        return self._caches.pokemon_names
 
     async def _get_pokemon_types(self) -> dict[int, Any]:
         """Get cached Pokemon types data."""
-        if self._pokemon_types_cache is None:
-            types_data = await self._fetch_json(endpoint="pokemon_types.json")
-            if types_data and isinstance(types_data, list):
-                # Convert list to dict for easier lookup by ID
-                self._pokemon_types_cache = {}
-                for pokemon in types_data:
-                    if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                        self._pokemon_types_cache[pokemon["pokemon_id"]] = pokemon
-            else:
-                self._pokemon_types_cache = {}
-        return self._pokemon_types_cache
+        async with self._caches.lock("pokemon_types"):
+            if self._caches.pokemon_types is None:
+                types_data = await self._fetch_json(endpoint="pokemon_types.json")
+                if types_data is None:
+                    return {}
+                pokemon_types: dict[int, Any] = {}
+                if isinstance(types_data, list):
+                    with suppress(KeyError, TypeError):
+                        # Convert list to dict for easier lookup by ID
+                        pokemon_types = {pokemon["pokemon_id"]: pokemon for pokemon in types_data}
+                self._caches.pokemon_types = pokemon_types
+        return self._caches.pokemon_types
 
     async def _get_pokemon_max_cp(self) -> dict[int, Any]:
         """Get cached Pokemon max CP data."""
-        if self._pokemon_max_cp_cache is None:
-            max_cp_data = await self._fetch_json(endpoint="pokemon_max_cp.json")
-            if max_cp_data and isinstance(max_cp_data, list):
-                # Convert list to dict for easier lookup by ID
-                # Handle multiple forms by preferring "Normal" form
-                self._pokemon_max_cp_cache = {}
-                for pokemon in max_cp_data:
-                    if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                        pokemon_id = pokemon["pokemon_id"]
-                        # Prefer Normal form, but use any form if Normal not available
-                        if pokemon_id not in self._pokemon_max_cp_cache or pokemon.get("form", "Normal") == "Normal":
-                            self._pokemon_max_cp_cache[pokemon_id] = pokemon
-            else:
-                self._pokemon_max_cp_cache = {}
-        return self._pokemon_max_cp_cache
+        async with self._caches.lock("pokemon_max_cp"):
+            if self._caches.pokemon_max_cp is None:
+                max_cp_data = await self._fetch_json(endpoint="pokemon_max_cp.json")
+                if max_cp_data is None:
+                    return {}
+                pokemon_max_cp: dict[int, Any] = {}
+                if isinstance(max_cp_data, list):
+                    with suppress(KeyError, TypeError, AttributeError):
+                        pokemon_max_cp = _index_preferring_normal_form(max_cp_data)
+                self._caches.pokemon_max_cp = pokemon_max_cp
+        return self._caches.pokemon_max_cp
 
     async def _get_shiny_pokemon(self) -> dict[int, bool]:
         """Get cached shiny Pokemon data."""
-        if self._shiny_pokemon_cache is None:
-            shiny_data = await self._fetch_json(endpoint="shiny_pokemon.json")
-            if shiny_data and isinstance(shiny_data, dict):
-                # Convert string keys to int keys
-                self._shiny_pokemon_cache = {}
-                for k, v in shiny_data.items():
-                    if isinstance(k, str) and k.isdigit():
-                        self._shiny_pokemon_cache[int(k)] = bool(v)
-            else:
-                self._shiny_pokemon_cache = {}
-        return self._shiny_pokemon_cache
+        async with self._caches.lock("shiny_pokemon"):
+            if self._caches.shiny_pokemon is None:
+                shiny_data = await self._fetch_json(endpoint="shiny_pokemon.json")
+                if shiny_data is None:
+                    return {}
+                shiny_pokemon: dict[int, bool] = {}
+                if isinstance(shiny_data, dict):
+                    with suppress(TypeError, ValueError):
+                        # Convert string keys to int keys
+                        shiny_pokemon = {int(k): bool(v) for k, v in shiny_data.items()}
+                self._caches.shiny_pokemon = shiny_pokemon
+        return self._caches.shiny_pokemon
 
     async def _get_released_pokemon(self) -> dict[int, bool]:
         """Get cached released Pokemon data."""
-        if self._released_pokemon_cache is None:
-            released_data = await self._fetch_json(endpoint="released_pokemon.json")
-            if released_data and isinstance(released_data, dict):
-                # Convert string keys to int keys
-                self._released_pokemon_cache = {}
-                for k, v in released_data.items():
-                    if isinstance(k, str) and k.isdigit():
-                        self._released_pokemon_cache[int(k)] = bool(v)
-            else:
-                self._released_pokemon_cache = {}
-        return self._released_pokemon_cache
+        async with self._caches.lock("released_pokemon"):
+            if self._caches.released_pokemon is None:
+                released_data = await self._fetch_json(endpoint="released_pokemon.json")
+                if released_data is None:
+                    return {}
+                released_pokemon: dict[int, bool] = {}
+                if isinstance(released_data, dict):
+                    with suppress(TypeError, ValueError):
+                        # Convert string keys to int keys
+                        released_pokemon = {int(k): bool(v) for k, v in released_data.items()}
+                self._caches.released_pokemon = released_pokemon
+        return self._caches.released_pokemon
 
     async def _get_buddy_distances(self) -> dict[int, int]:
         """Get cached buddy distances data."""
-        if self._buddy_distances_cache is None:
-            buddy_data = await self._fetch_json(endpoint="pokemon_buddy_distances.json")
-            if buddy_data and isinstance(buddy_data, dict):
-                # Flatten the structure for easier lookup
-                self._buddy_distances_cache = {}
-                for distance, pokemon_list in buddy_data.items():
-                    if isinstance(pokemon_list, list):
-                        for pokemon in pokemon_list:
-                            if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                                self._buddy_distances_cache[pokemon["pokemon_id"]] = int(distance)
-            else:
-                self._buddy_distances_cache = {}
-        return self._buddy_distances_cache
+        async with self._caches.lock("buddy_distances"):
+            if self._caches.buddy_distances is None:
+                buddy_data = await self._fetch_json(endpoint="pokemon_buddy_distances.json")
+                if buddy_data is None:
+                    return {}
+                buddy_distances: dict[int, int] = {}
+                if isinstance(buddy_data, dict):
+                    with suppress(KeyError, TypeError, ValueError):
+                        # Flatten the structure for easier lookup
+                        buddy_distances = {
+                            pokemon["pokemon_id"]: int(distance)
+                            for distance, pokemon_list in buddy_data.items()
+                            for pokemon in pokemon_list
+                        }
+                self._caches.buddy_distances = buddy_distances
+        return self._caches.buddy_distances
 
     async def _get_candy_to_evolve(self) -> dict[int, int]:
         """Get cached candy to evolve data."""
-        if self._candy_to_evolve_cache is None:
-            candy_data = await self._fetch_json(endpoint="pokemon_candy_to_evolve.json")
-            if candy_data and isinstance(candy_data, dict):
-                # Flatten the structure for easier lookup
-                self._candy_to_evolve_cache = {}
-                for candy_amount, pokemon_list in candy_data.items():
-                    if isinstance(pokemon_list, list):
-                        for pokemon in pokemon_list:
-                            if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                                self._candy_to_evolve_cache[pokemon["pokemon_id"]] = int(candy_amount)
-            else:
-                self._candy_to_evolve_cache = {}
-        return self._candy_to_evolve_cache
+        async with self._caches.lock("candy_to_evolve"):
+            if self._caches.candy_to_evolve is None:
+                candy_data = await self._fetch_json(endpoint="pokemon_candy_to_evolve.json")
+                if candy_data is None:
+                    return {}
+                candy_to_evolve: dict[int, int] = {}
+                if isinstance(candy_data, dict):
+                    with suppress(KeyError, TypeError, ValueError):
+                        # Flatten the structure for easier lookup
+                        candy_to_evolve = {
+                            pokemon["pokemon_id"]: int(candy_amount)
+                            for candy_amount, pokemon_list in candy_data.items()
+                            for pokemon in pokemon_list
+                        }
+                self._caches.candy_to_evolve = candy_to_evolve
+        return self._caches.candy_to_evolve
 
     async def _get_pokemon_rarity(self) -> dict[int, str]:
         """Get cached Pokemon rarity data."""
-        if self._pokemon_rarity_cache is None:
-            rarity_data = await self._fetch_json(endpoint="pokemon_rarity.json")
-            if rarity_data and isinstance(rarity_data, dict):
-                # Flatten the structure for easier lookup
-                self._pokemon_rarity_cache = {}
-                for rarity, pokemon_list in rarity_data.items():
-                    if isinstance(pokemon_list, list):
-                        for pokemon in pokemon_list:
-                            if isinstance(pokemon, dict) and "pokemon_id" in pokemon:
-                                self._pokemon_rarity_cache[pokemon["pokemon_id"]] = rarity
-            else:
-                self._pokemon_rarity_cache = {}
-        return self._pokemon_rarity_cache
-
-    async def _get_cp_multiplier(self) -> list[Any]:
-        """Get cached CP multiplier data."""
-        if self._cp_multiplier_cache is None:
-            cp_data = await self._fetch_json(endpoint="cp_multiplier.json")
-            if cp_data and isinstance(cp_data, list):
-                self._cp_multiplier_cache = cp_data
-            else:
-                self._cp_multiplier_cache = []
-        return self._cp_multiplier_cache
+        async with self._caches.lock("pokemon_rarity"):
+            if self._caches.pokemon_rarity is None:
+                rarity_data = await self._fetch_json(endpoint="pokemon_rarity.json")
+                if rarity_data is None:
+                    return {}
+                pokemon_rarity: dict[int, str] = {}
+                if isinstance(rarity_data, dict):
+                    with suppress(KeyError, TypeError):
+                        # Flatten the structure for easier lookup
+                        pokemon_rarity = {
+                            pokemon["pokemon_id"]: rarity
+                            for rarity, pokemon_list in rarity_data.items()
+                            for pokemon in pokemon_list
+                        }
+                self._caches.pokemon_rarity = pokemon_rarity
+        return self._caches.pokemon_rarity
+
+    async def _get_cp_multiplier(self) -> dict[float, float]:
+        """Get cached CP multiplier data, keyed by level."""
+        async with self._caches.lock("cp_multiplier"):
+            if self._caches.cp_multiplier is None:
+                cp_data = await self._fetch_json(endpoint="cp_multiplier.json")
+                if cp_data is None:
+                    return {}
+                cp_multiplier: dict[float, float] = {}
+                if isinstance(cp_data, list):
+                    with suppress(KeyError, TypeError, ValueError):
+                        # Convert list to dict for direct lookup by level
+                        cp_multiplier = {float(entry["level"]): float(entry["multiplier"]) for entry in cp_data}
+                self._caches.cp_multiplier = cp_multiplier
+        return self._caches.cp_multiplier
 
     async def _get_pokemon_evolutions(self) -> dict[int, Any]:
         """Get cached Pokemon evolution data."""
-        if self._pokemon_evolutions_cache is None:
-            evolution_data = await self._fetch_json(endpoint="pokemon_evolutions.json")
-            if evolution_data and isinstance(evolution_data, list):
-                # Convert list to dict for easier lookup by ID
-                self._pokemon_evolutions_cache = {}
-                for evolution in evolution_data:
-                    if isinstance(evolution, dict) and "pokemon_id" in evolution:
-                        pokemon_id = evolution["pokemon_id"]
-                        self._pokemon_evolutions_cache[pokemon_id] = evolution
-            else:
-                self._pokemon_evolutions_cache = {}
-        return self._pokemon_evolutions_cache
+        async with self._caches.lock("pokemon_evolutions"):
+            if self._caches.pokemon_evolutions is None:
+                evolution_data = await self._fetch_json(endpoint="pokemon_evolutions.json")
+                if evolution_data is None:
+                    return {}
+                pokemon_evolutions: dict[int, Any] = {}
+                evolution_children: dict[int, tuple[int, ...]] = {}
+                if isinstance(evolution_data, list):
+                    with suppress(KeyError, TypeError, AttributeError):
+                        # Convert list to dict for easier lookup by ID
+                        pokemon_evolutions = {evolution["pokemon_id"]: evolution for evolution in evolution_data}
+                        evolution_children = {
+                            pokemon_id: tuple(evolution["pokemon_id"] for evolution in info.get("evolutions", ()))
+                            for pokemon_id, info in pokemon_evolutions.items()
+                        }
+                self._caches.evolution_children = evolution_children
+                self._caches.pokemon_evolutions = pokemon_evolutions
+        return self._caches.pokemon_evolutions
 
     async def _get_mega_pokemon(self) -> dict[int, list[Any]]:
         """Get cached mega Pokemon data."""
-        if self._mega_pokemon_cache is None:
-            mega_data = await self._fetch_json(endpoint="mega_pokemon.json")
-            if mega_data and isinstance(mega_data, list):
-                # Convert list to dict for easier lookup by ID
-                self._mega_pokemon_cache = {}
-                for mega in mega_data:
-                    if isinstance(mega, dict) and "pokemon_id" in mega:
-                        pokemon_id = mega["pokemon_id"]
-                        # Handle multiple mega forms
-                        if pokemon_id not in self._mega_pokemon_cache:
-                            self._mega_pokemon_cache[pokemon_id] = []
-                        self._mega_pokemon_cache[pokemon_id].append(mega)
-            else:
-                self._mega_pokemon_cache = {}
-        return self._mega_pokemon_cache
-
-    def _calculate_cp_for_level(
-        self, *, base_attack: int, base_defense: int, base_stamina: int, level: float, cp_multipliers: list[Any]
-    ) -> int:
-        """Calculate CP for a specific level using PoGo formula.
+        async with self._caches.lock("mega_pokemon"):
+            if self._caches.mega_pokemon is None:
+                mega_data = await self._fetch_json(endpoint="mega_pokemon.json")
+                if mega_data is None:
+                    return {}
+                mega_pokemon: dict[int, list[Any]] = {}
+                if isinstance(mega_data, list):
+                    with suppress(KeyError, TypeError):
+                        # Convert list to dict for easier lookup by ID, keeping every mega form
+                        mega_forms: dict[int, list[Any]] = {}
+                        for mega in mega_data:
+                            mega_forms.setdefault(mega["pokemon_id"], []).append(mega)
+                        mega_pokemon = mega_forms
+
+                self._caches.mega_ids = frozenset(mega_pokemon)
+                self._caches.mega_pokemon = mega_pokemon
+        return self._caches.mega_pokemon
+
+    async def _warm_caches(self) -> None:
+        """Populate every cache needed by `get_pokemon_data` with concurrent requests."""
+        await asyncio.gather(
+            self._get_pokemon_stats(),
+            self._get_pokemon_names(),
+            self._get_pokemon_types(),
+            self._get_pokemon_max_cp(),
+            self._get_shiny_pokemon(),
+            self._get_released_pokemon(),
+            self._get_buddy_distances(),
+            self._get_candy_to_evolve(),
+            self._get_pokemon_rarity(),
+            self._get_cp_multiplier(),
+        )
+
+    def _calculate_cp_values(
+        self, *, base_attack: int, base_defense: int, base_stamina: int, cp_multipliers: dict[float, float]
+    ) -> tuple[int, ...]:
+        """Calculate CP for every level in `CP_LEVELS` using PoGo formula.
 
         Args:
             base_attack: Base attack stat.
             base_defense: Base defense stat.
             base_stamina: Base stamina stat.
-            level: Pokemon level.
-            cp_multipliers: List of CP multipliers from API.
+            cp_multipliers: CP multipliers from API, keyed by level.
 
         Returns:
-            Calculated CP value.
+            Calculated CP values, in the same order as `CP_LEVELS`.
         """
-        # Find the multiplier for the given level
-        multiplier = 0.5  # Default fallback
+        # Use perfect IVs (15/15/15) for max CP calculation
+        attack = base_attack + 15
+        defense = base_defense + 15
+        stamina = base_stamina + 15
 
-        for cp_data in cp_multipliers:
-            if cp_data["level"] == level:
-                multiplier = cp_data["multiplier"]
-                break
+        cp_values = []
+        for level in CP_LEVELS:
+            # Find the multiplier for the given level, falling back to 0.5
+            multiplier = cp_multipliers.get(level, 0.5)
 
-        # Use perfect IVs (15/15/15) for max CP calculation
-        attack = (base_attack + 15) * multiplier
-        defense = (base_defense + 15) * multiplier
-        stamina = (base_stamina + 15) * multiplier
+            # PoGo CP formula
+            cp = int(((attack * multiplier) * ((defense * multiplier) ** 0.5) * ((stamina * multiplier) ** 0.5)) / 10)
+            cp_values.append(max(cp, 10))  # Minimum CP is 10
 
-        # PoGo CP formula
-        cp = int((attack * (defense**0.5) * (stamina**0.5)) / 10)
-        return max(cp, 10)  # Minimum CP is 10
+        return tuple(cp_values)
 
     async def get_pokemon_data(self, *, name: str) -> PokemonData | None:
         """Fetch Pokémon data by name.
@@ -359,35 +552,26 @@ class PoGoAPIClient:
             PokemonData object if found, None otherwise.
         """
         try:
-            # Get all cached data
-            pokemon_stats = await self._get_pokemon_stats()
-            pokemon_names = await self._get_pokemon_names()
-            pokemon_types = await self._get_pokemon_types()
-            pokemon_max_cp = await self._get_pokemon_max_cp()
-            shiny_pokemon = await self._get_shiny_pokemon()
-            released_pokemon = await self._get_released_pokemon()
-            buddy_distances = await self._get_buddy_distances()
-            candy_to_evolve = await self._get_candy_to_evolve()
-            pokemon_rarity = await self._get_pokemon_rarity()
-            cp_multipliers = await self._get_cp_multiplier()
+            # Fetch any missing endpoints concurrently, then read the caches directly rather than through the
+            # getters, which would request an endpoint that just failed a second time
+            await self._warm_caches()
+            caches = self._caches
+            pokemon_stats = caches.pokemon_stats or {}
+            pokemon_types = caches.pokemon_types or {}
+            pokemon_max_cp = caches.pokemon_max_cp or {}
+            shiny_pokemon = caches.shiny_pokemon or {}
+            released_pokemon = caches.released_pokemon or {}
+            buddy_distances = caches.buddy_distances or {}
+            candy_to_evolve = caches.candy_to_evolve or {}
+            pokemon_rarity = caches.pokemon_rarity or {}
+            cp_multipliers = caches.cp_multiplier or {}
 
             # Find Pokemon by name (case-insensitive)
-            pokemon_id = None
-            pokemon_name = None
-
-            for pid, pdata in pokemon_names.items():
-                if pdata["name"].lower() == name.lower():
-                    pokemon_id = pid
-                    pokemon_name = pdata["name"]
-                    break
-
-            if pokemon_id is None:
+            name_match = caches.pokemon_names_by_lower.get(name.lower())
+            if name_match is None:
                 return None
 
-            # At this point, pokemon_name should also be set
-            if pokemon_name is None:
-                print(f"Error: pokemon_name is None for pokemon_id {pokemon_id}")
-                return None
+            pokemon_id, pokemon_name = name_match
 
             # Get stats
             stats = pokemon_stats.get(pokemon_id)
@@ -399,14 +583,10 @@ class PoGoAPIClient:
             types = []
             if types_data:
                 for type_name in types_data["type"]:
-                    try:
-                        # Convert PoGo type names to our enum format
-                        type_name_lower = type_name.lower()
-                        pokemon_type = PokemonType(type_name_lower)
+                    # Convert PoGo type names to our enum format, skipping unknown types
+                    pokemon_type = _TYPE_BY_LOWER.get(type_name.lower())
+                    if pokemon_type is not None:
                         types.append(pokemon_type)
-                    except ValueError:
-                        # Skip unknown types
-                        continue
 
             # Get base stats
             base_attack = int(stats["base_attack"])
@@ -414,32 +594,10 @@ class PoGoAPIClient:
             base_stamina = int(stats["base_stamina"])
 
             # Calculate CP values for different levels
-            cp_level_20 = self._calculate_cp_for_level(
+            cp_level_20, cp_level_25, cp_level_30, cp_level_40 = self._calculate_cp_values(
                 base_attack=base_attack,
                 base_defense=base_defense,
                 base_stamina=base_stamina,
-                level=20.0,
-                cp_multipliers=cp_multipliers,
-            )
-            cp_level_25 = self._calculate_cp_for_level(
-                base_attack=base_attack,
-                base_defense=base_defense,
-                base_stamina=base_stamina,
-                level=25.0,
-                cp_multipliers=cp_multipliers,
-            )
-            cp_level_30 = self._calculate_cp_for_level(
-                base_attack=base_attack,
-                base_defense=base_defense,
-                base_stamina=base_stamina,
-                level=30.0,
-                cp_multipliers=cp_multipliers,
-            )
-            cp_level_40 = self._calculate_cp_for_level(
-                base_attack=base_attack,
-                base_defense=base_defense,
-                base_stamina=base_stamina,
-                level=40.0,
                 cp_multipliers=cp_multipliers,
             )
 
@@ -476,7 +634,7 @@ class PoGoAPIClient:
             )
 
         except Exception as e:
-            print(f"Error fetching data for {name}: {e}")
+            logger.warning("Error fetching data for %s: %s", name, e)
             return None
 
     async def search_pokemon_by_partial_name(self, *, partial_name: str, limit: int = 5) -> list[str]:
@@ -487,25 +645,18 @@ class PoGoAPIClient:
             limit: Maximum number of results to return.
 
         Returns:
-            List of matching Pokémon names.
+            Alphabetically first matching Pokémon names, at most limit of them.
         """
         try:
-            pokemon_names = await self._get_pokemon_names()
+            await self._get_pokemon_names()
 
-            # Filter by partial name match
-            matches = []
+            # Filter by partial name match, then keep the alphabetical top matches
             partial_lower = partial_name.lower()
-
-            for pokemon_data in pokemon_names.values():
-                if partial_lower in pokemon_data["name"].lower():
-                    matches.append(pokemon_data["name"])
-                    if len(matches) >= limit:
-                        break
-
-            return sorted(matches)
+            matches = [name for name_lower, name in self._caches.pokemon_names_lower if partial_lower in name_lower]
+            return sorted(matches)[:limit]
 
         except Exception as e:
-            print(f"Error searching for Pokémon: {e}")
+            logger.warning("Error searching for Pokémon: %s", e)
             return []
 
     async def get_evolution_data(self, *, pokemon_id: int) -> EvolutionData | None:
@@ -551,7 +702,7 @@ class PoGoAPIClient:
             )
 
         except Exception as e:
-            print(f"Error fetching evolution data for ID {pokemon_id}: {e}")
+            logger.warning("Error fetching evolution data for ID %s: %s", pokemon_id, e)
             return None
 
     async def get_mega_evolution_data(self, *, pokemon_id: int) -> list[MegaEvolutionData]:
@@ -572,12 +723,9 @@ class PoGoAPIClient:
                 # Parse types
                 types = []
                 for type_name in mega.get("type", []):
-                    try:
-                        type_name_lower = type_name.lower()
-                        pokemon_type = PokemonType(type_name_lower)
+                    pokemon_type = _TYPE_BY_LOWER.get(type_name.lower())
+                    if pokemon_type is not None:
                         types.append(pokemon_type)
-                    except ValueError:
-                        continue
 
                 mega_evolution = MegaEvolutionData(
                     pokemon_id=mega["pokemon_id"],
@@ -597,7 +745,7 @@ class PoGoAPIClient:
             return result
 
         except Exception as e:
-            print(f"Error fetching mega evolution data for ID {pokemon_id}: {e}")
+            logger.warning("Error fetching mega evolution data for ID %s: %s", pokemon_id, e)
             return []
 
     async def check_evolution_line_has_mega(self, *, pokemon_id: int) -> bool:
@@ -610,27 +758,113 @@ class PoGoAPIClient:
             True if any Pokémon in the evolution line can mega evolve.
         """
         try:
-            # Check if this Pokémon can mega evolve
-            mega_data = await self.get_mega_evolution_data(pokemon_id=pokemon_id)
-            if mega_data:
-                return True
-
-            # Check if any of its evolutions can mega evolve
-            evolution_data = await self.get_evolution_data(pokemon_id=pokemon_id)
-            if evolution_data and evolution_data.evolutions:
-                for evolution in evolution_data.evolutions:
-                    evolution_mega_data = await self.get_mega_evolution_data(pokemon_id=evolution.pokemon_id)
-                    if evolution_mega_data:
-                        return True
+            await asyncio.gather(self._get_mega_pokemon(), self._get_pokemon_evolutions())
 
-            return False
+            # Check if this Pokémon or any of its evolutions can mega evolve
+            mega_ids = self._caches.mega_ids
+            return pokemon_id in mega_ids or not mega_ids.isdisjoint(
+                self._caches.evolution_children.get(pokemon_id, ())
+            )
 
         except Exception as e:
-            print(f"Error checking mega evolution line for ID {pokemon_id}: {e}")
+            logger.warning("Error checking mega evolution line for ID %s: %s", pokemon_id, e)
             return False
 
 
-# Synchronous wrapper functions for easier use
+def _index_preferring_normal_form(entries: list[Any]) -> dict[int, Any]:
+    """Index per-form API entries by Pokémon ID, preferring the "Normal" form.
+
+    Args:
+        entries: API entries with a "pokemon_id" and optional "form" key.
+
+    Returns:
+        Dictionary mapping Pokémon IDs to their entry.
+    """
+    indexed: dict[int, Any] = {}
+    for entry in entries:
+        pokemon_id = entry["pokemon_id"]
+        # Prefer Normal form, but use any form if Normal not available
+        if pokemon_id not in indexed or entry.get("form", "Normal") == "Normal":
+            indexed[pokemon_id] = entry
+    return indexed
+
+
+def _load_cached_body(*, body_path: Path) -> dict[str, Any] | list[Any] | None:
+    """Load a cached response body.
+
+    Args:
+        body_path: Path of the cached response body.
+
+    Returns:
+        The parsed JSON, or None if the file is missing or not valid JSON.
+    """
+    try:
+        cached_data: dict[str, Any] | list[Any] = orjson.loads(body_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return cached_data
+
+
+def _write_atomically(*, path: Path, data: bytes) -> None:
+    """Write data to a file so readers never observe a partially written file.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+# Synchronous wrapper functions for easier use. They share one client on a background
+# event loop so connections and cached payloads survive between calls.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_client: PoGoAPIClient | None = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop used by the sync wrappers, starting it on first use.
+
+    Returns:
+        Event loop running forever in a daemon thread.
+    """
+    global _background_loop
+
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="pogo-api-loop", daemon=True).start()
+            atexit.register(_stop_background_loop)
+            _background_loop = loop
+        return _background_loop
+
+
+async def _get_background_client() -> PoGoAPIClient:
+    """Get the client shared by the sync wrappers (runs on the background loop).
+
+    Returns:
+        Shared PoGoAPIClient instance.
+    """
+    global _background_client
+
+    if _background_client is None:
+        _background_client = PoGoAPIClient()
+    return _background_client
+
+
+def _stop_background_loop() -> None:
+    """Close the shared client and stop the background loop at interpreter exit."""
+    if _background_loop is None:
+        return
+
+    if _background_client is not None:
+        with suppress(Exception):
+            asyncio.run_coroutine_threadsafe(_background_client.client.aclose(), _background_loop).result(timeout=5)
+    _background_loop.call_soon_threadsafe(_background_loop.stop)
+
+
 def get_pokemon_data_sync(*, name: str) -> PokemonData | None:
     """Synchronous wrapper for getting Pokémon data.
 
@@ -642,10 +876,10 @@ def get_pokemon_data_sync(*, name: str) -> PokemonData | None:
     """
 
     async def _fetch() -> PokemonData | None:
-        async with PoGoAPIClient() as client:
-            return await client.get_pokemon_data(name=name)
+        client = await _get_background_client()
+        return await client.get_pokemon_data(name=name)
 
-    return asyncio.run(_fetch())
+    return asyncio.run_coroutine_threadsafe(_fetch(), _get_background_loop()).result()
 
 
 def search_pokemon_sync(*, partial_name: str, limit: int = 5) -> list[str]:
@@ -660,7 +894,7 @@ def search_pokemon_sync(*, partial_name: str, limit: int = 5) -> list[str]:
     """
 
     async def _search() -> list[str]:
-        async with PoGoAPIClient() as client:
-            return await client.search_pokemon_by_partial_name(partial_name=partial_name, limit=limit)
+        client = await _get_background_client()
+        return await client.search_pokemon_by_partial_name(partial_name=partial_name, limit=limit)
 
-    return asyncio.run(_search())
+    return asyncio.run_coroutine_threadsafe(_search(), _get_background_loop()).result()
@@ -6,27 +6,30 @@ maintenance operations.
 """
 
 import asyncio
+import sys
 from typing import TYPE_CHECKING
 
+from pokemon_meetup.cli.common import format_type_info, prompt_int
 from pokemon_meetup.services.pokemon_service import get_pokemon_service
-from pokemon_meetup.templates.manager import get_template_manager
 from pokemon_meetup.web.pokemon_api import PokemonData
 
 if TYPE_CHECKING:
     from pokemon_meetup.services.pokemon_service import PokemonService
 
+# Number of Pokémon written to stdout at once by the full listing
+_LISTING_PAGE_SIZE = 100
 
-def format_type_info(*, pokemon_data: PokemonData) -> str:
-    """Format Pokémon type information with Spanish names and emojis.
-
-    Args:
-        pokemon_data: PokemonData object containing type information.
-
-    Returns:
-        Formatted string with type names and emojis in Spanish.
-    """
-    template_manager = get_template_manager()
-    return template_manager._format_type_info(pokemon_data=pokemon_data)
+# One entry of the full listing, ending with a blank line
+_ROW_TEMPLATE = (
+    "{i:3d}. {pokemon.name} (#{pokemon.id:03d})\n"
+    "     📊 Type: {type_info}\n"
+    "     💪 Max CP: {pokemon.max_cp:,}\n"
+    "     🎯 Rarity: {rarity}\n"
+    "     ✨ Shiny: {shiny}{stardust_line}\n"
+    "     📈 Stats: ATK {pokemon.base_attack} | DEF {pokemon.base_defense} | STA {pokemon.base_stamina}\n"
+    "     🏆 CP: L20({pokemon.cp_level_20:,}) L25({pokemon.cp_level_25:,}) "
+    "L30({pokemon.cp_level_30:,}) L40({pokemon.cp_level_40:,}){extra_line}\n"
+)
 
 
 def display_all_pokemon(*, service: "PokemonService") -> None:
@@ -35,46 +38,44 @@ def display_all_pokemon(*, service: "PokemonService") -> None:
     Args:
         service: PokemonService instance.
     """
-    all_pokemon = service.list_cached_pokemon()
+    total_pokemon = service.database.get_row_count()
 
-    if not all_pokemon:
+    if not total_pokemon:
         print("📁 No Pokémon found in database.")
         return
 
-    print(f"📁 Found {len(all_pokemon)} Pokémon in database:")
-    print("=" * 80)
-
-    for i, pokemon in enumerate(all_pokemon, 1):
-        type_info = format_type_info(pokemon_data=pokemon)
-        print(f"{i:3d}. {pokemon.name} (#{pokemon.id:03d})")
-        print(f"     📊 Type: {type_info}")
-        print(f"     💪 Max CP: {pokemon.max_cp:,}")
-        print(f"     🎯 Rarity: {pokemon.rarity or 'Unknown'}")
-        print(f"     ✨ Shiny: {'Yes' if pokemon.is_shiny_available else 'No'}")
-
-        # Show base stardust if available
-        if pokemon.base_stardust is not None:
-            print(f"     💫 Base Stardust: {pokemon.base_stardust}")
+    lines = [f"📁 Found {total_pokemon} Pokémon in database:", "=" * 80]
 
-        # Show base stats
-        print(f"     📈 Stats: ATK {pokemon.base_attack} | DEF {pokemon.base_defense} | STA {pokemon.base_stamina}")
+    # Rows are streamed from the database and written out a page at a time
+    for i, pokemon in enumerate(service.iter_cached_pokemon(), 1):
+        # Optional lines are only shown when the data is available
+        stardust_line = "" if pokemon.base_stardust is None else f"\n     💫 Base Stardust: {pokemon.base_stardust}"
 
-        # Show CP values
-        print(
-            f"     🏆 CP: L20({pokemon.cp_level_20:,}) L25({pokemon.cp_level_25:,}) "
-            f"L30({pokemon.cp_level_30:,}) L40({pokemon.cp_level_40:,})"
-        )
-
-        # Show additional info if available
         extra_info = []
         if pokemon.buddy_distance:
             extra_info.append(f"🚶{pokemon.buddy_distance}km")
         if pokemon.candy_to_evolve:
             extra_info.append(f"🍬{pokemon.candy_to_evolve}")
-        if extra_info:
-            print(f"     i  {' | '.join(extra_info)}")
+        extra_line = f"\n     i  {' | '.join(extra_info)}" if extra_info else ""
+
+        lines.append(
+            _ROW_TEMPLATE.format(
+                i=i,
+                pokemon=pokemon,
+                type_info=format_type_info(pokemon_data=pokemon),
+                rarity=pokemon.rarity or "Unknown",
+                shiny="Yes" if pokemon.is_shiny_available else "No",
+                stardust_line=stardust_line,
+                extra_line=extra_line,
+            )
+        )
 
-        print()
+        if i % _LISTING_PAGE_SIZE == 0:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def show_pokemon_details(*, service: "PokemonService", pokemon_index: int) -> None:
@@ -84,40 +85,48 @@ def show_pokemon_details(*, service: "PokemonService", pokemon_index: int) -> No
         service: PokemonService instance.
         pokemon_index: 1-based index of the Pokémon to show.
     """
-    all_pokemon = service.list_cached_pokemon()
+    # Only load the requested row rather than the whole table
+    selected = service.list_cached_pokemon(limit=1, offset=pokemon_index - 1) if pokemon_index >= 1 else []
 
-    if not all_pokemon or pokemon_index < 1 or pokemon_index > len(all_pokemon):
+    if not selected:
         print("❌ Invalid Pokémon index.")
         return
 
-    pokemon = all_pokemon[pokemon_index - 1]
+    pokemon = selected[0]
     type_info = format_type_info(pokemon_data=pokemon)
 
-    print(f"📄 Detailed information for {pokemon.name}:")
-    print("=" * 50)
-    print(f"🆔 ID: #{pokemon.id:03d}")
-    print(f"📊 Type: {type_info}")
-    print(f"🎯 Rarity: {pokemon.rarity or 'Unknown'}")
-    print(f"✨ Shiny available: {'Yes' if pokemon.is_shiny_available else 'No'}")
-    print(f"🎮 Released: {'Yes' if pokemon.is_released else 'No'}")
+    lines = [
+        f"📄 Detailed information for {pokemon.name}:",
+        "=" * 50,
+        f"🆔 ID: #{pokemon.id:03d}",
+        f"📊 Type: {type_info}",
+        f"🎯 Rarity: {pokemon.rarity or 'Unknown'}",
+        f"✨ Shiny available: {'Yes' if pokemon.is_shiny_available else 'No'}",
+        f"🎮 Released: {'Yes' if pokemon.is_released else 'No'}",
+    ]
 
     if pokemon.buddy_distance:
-        print(f"🚶 Buddy distance: {pokemon.buddy_distance} km")
+        lines.append(f"🚶 Buddy distance: {pokemon.buddy_distance} km")
 
     if pokemon.candy_to_evolve:
-        print(f"🍬 Candy to evolve: {pokemon.candy_to_evolve}")
-
-    print("\n📈 Base Stats:")
-    print(f"   ⚔️  Attack: {pokemon.base_attack}")
-    print(f"   🛡️  Defense: {pokemon.base_defense}")
-    print(f"   ❤️  Stamina: {pokemon.base_stamina}")
+        lines.append(f"🍬 Candy to evolve: {pokemon.candy_to_evolve}")
+
+    lines.extend(
+        (
+            "\n📈 Base Stats:",
+            f"   ⚔️  Attack: {pokemon.base_attack}",
+            f"   🛡️  Defense: {pokemon.base_defense}",
+            f"   ❤️  Stamina: {pokemon.base_stamina}",
+            "\n💪 CP Values (Perfect IVs):",
+            f"   Level 20: {pokemon.cp_level_20:,} CP",
+            f"   Level 25: {pokemon.cp_level_25:,} CP",
+            f"   Level 30: {pokemon.cp_level_30:,} CP",
+            f"   Level 40: {pokemon.cp_level_40:,} CP",
+            f"   Maximum: {pokemon.max_cp:,} CP",
+        )
+    )
 
-    print("\n💪 CP Values (Perfect IVs):")
-    print(f"   Level 20: {pokemon.cp_level_20:,} CP")
-    print(f"   Level 25: {pokemon.cp_level_25:,} CP")
-    print(f"   Level 30: {pokemon.cp_level_30:,} CP")
-    print(f"   Level 40: {pokemon.cp_level_40:,} CP")
-    print(f"   Maximum: {pokemon.max_cp:,} CP")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def show_database_stats(*, service: "PokemonService") -> None:
@@ -140,21 +149,7 @@ def show_database_stats(*, service: "PokemonService") -> None:
     # Additional statistics
     total_pokemon = stats.get("total_pokemon", 0)
     if isinstance(total_pokemon, int) and total_pokemon > 0:
-        all_pokemon = service.list_cached_pokemon()
-
-        # Count by rarity
-        rarity_counts: dict[str, int] = {}
-        shiny_count = 0
-        released_count = 0
-
-        for pokemon in all_pokemon:
-            rarity = pokemon.rarity or "Unknown"
-            rarity_counts[rarity] = rarity_counts.get(rarity, 0) + 1
-
-            if pokemon.is_shiny_available:
-                shiny_count += 1
-            if pokemon.is_released:
-                released_count += 1
+        rarity_counts, shiny_count, released_count = service.get_rarity_breakdown()
 
         print("\n📈 Breakdown:")
         print(f"Released Pokémon: {released_count}")
@@ -196,21 +191,12 @@ async def search_pokemon_by_name(*, service: "PokemonService") -> None:
             print(f"  {i}. {suggestion.name}")
         print(f"  {len(suggestions) + 1}. Cancel")
 
-        while True:
-            try:
-                choice = input(f"\n🎯 Select an option (1-{len(suggestions) + 1}): ").strip()
-                choice_num = int(choice)
-
-                if 1 <= choice_num <= len(suggestions):
-                    pokemon_data = suggestions[choice_num - 1]
-                    break
-                elif choice_num == len(suggestions) + 1:
-                    return
-                else:
-                    print(f"❌ Please enter a number between 1 and {len(suggestions) + 1}.")
-
-            except ValueError:
-                print("❌ Please enter a valid number.")
+        choice_num = prompt_int(
+            prompt=f"\n🎯 Select an option (1-{len(suggestions) + 1}): ", low=1, high=len(suggestions) + 1
+        )
+        if choice_num == len(suggestions) + 1:
+            return
+        pokemon_data = suggestions[choice_num - 1]
 
     # Show detailed information
     show_pokemon_details_data(pokemon_data=pokemon_data)
@@ -224,34 +210,41 @@ def show_pokemon_details_data(*, pokemon_data: PokemonData) -> None:
     """
     type_info = format_type_info(pokemon_data=pokemon_data)
 
-    print(f"\n📄 Detailed information for {pokemon_data.name}:")
-    print("=" * 60)
-    print(f"🆔 ID: #{pokemon_data.id:03d}")
-    print(f"📊 Type: {type_info}")
-    print(f"🎯 Rarity: {pokemon_data.rarity or 'Unknown'}")
-    print(f"✨ Shiny available: {'Yes' if pokemon_data.is_shiny_available else 'No'}")
-    print(f"🎮 Released: {'Yes' if pokemon_data.is_released else 'No'}")
+    lines = [
+        f"\n📄 Detailed information for {pokemon_data.name}:",
+        "=" * 60,
+        f"🆔 ID: #{pokemon_data.id:03d}",
+        f"📊 Type: {type_info}",
+        f"🎯 Rarity: {pokemon_data.rarity or 'Unknown'}",
+        f"✨ Shiny available: {'Yes' if pokemon_data.is_shiny_available else 'No'}",
+        f"🎮 Released: {'Yes' if pokemon_data.is_released else 'No'}",
+    ]
 
     if pokemon_data.buddy_distance:
-        print(f"🚶 Buddy distance: {pokemon_data.buddy_distance} km")
+        lines.append(f"🚶 Buddy distance: {pokemon_data.buddy_distance} km")
 
     if pokemon_data.candy_to_evolve:
-        print(f"🍬 Candy to evolve: {pokemon_data.candy_to_evolve}")
+        lines.append(f"🍬 Candy to evolve: {pokemon_data.candy_to_evolve}")
 
     if pokemon_data.base_stardust is not None:
-        print(f"💫 Base stardust: {pokemon_data.base_stardust}")
-
-    print("\n📈 Base Stats:")
-    print(f"   ⚔️  Attack: {pokemon_data.base_attack}")
-    print(f"   🛡️  Defense: {pokemon_data.base_defense}")
-    print(f"   ❤️  Stamina: {pokemon_data.base_stamina}")
-
-    print("\n💪 CP Values (Perfect IVs):")
-    print(f"   Level 20: {pokemon_data.cp_level_20:,} CP")
-    print(f"   Level 25: {pokemon_data.cp_level_25:,} CP")
-    print(f"   Level 30: {pokemon_data.cp_level_30:,} CP")
-    print(f"   Level 40: {pokemon_data.cp_level_40:,} CP")
-    print(f"   Maximum: {pokemon_data.max_cp:,} CP")
+        lines.append(f"💫 Base stardust: {pokemon_data.base_stardust}")
+
+    lines.extend(
+        (
+            "\n📈 Base Stats:",
+            f"   ⚔️  Attack: {pokemon_data.base_attack}",
+            f"   🛡️  Defense: {pokemon_data.base_defense}",
+            f"   ❤️  Stamina: {pokemon_data.base_stamina}",
+            "\n💪 CP Values (Perfect IVs):",
+            f"   Level 20: {pokemon_data.cp_level_20:,} CP",
+            f"   Level 25: {pokemon_data.cp_level_25:,} CP",
+            f"   Level 30: {pokemon_data.cp_level_30:,} CP",
+            f"   Level 40: {pokemon_data.cp_level_40:,} CP",
+            f"   Maximum: {pokemon_data.max_cp:,} CP",
+        )
+    )
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def search_and_add_pokemon(*, service: "PokemonService") -> None:
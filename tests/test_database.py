@@ -0,0 +1,203 @@
+"""Tests for the SQLite Pokémon database."""
+
+import sqlite3
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pokemon_meetup.common.pokemon_types import PokemonType
+from pokemon_meetup.database.models import DatabaseConfig, PokemonDatabase
+from pokemon_meetup.web.pokemon_api import PokemonData
+
+
+def _make_pokemon(*, pokemon_id: int, name: str, rarity: str | None = "Standard") -> PokemonData:
+    """Build a PokemonData record with placeholder stats."""
+    return PokemonData(
+        name=name,
+        id=pokemon_id,
+        types=[PokemonType.ELECTRIC],
+        base_attack=112,
+        base_defense=96,
+        base_stamina=111,
+        cp_level_20=500,
+        cp_level_25=625,
+        cp_level_30=750,
+        cp_level_40=938,
+        max_cp=938,
+        rarity=rarity,
+    )
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> PokemonDatabase:
+    """Create a file-backed database holding Pikachu and Raichu."""
+    db = PokemonDatabase(config=DatabaseConfig(db_path=tmp_path / "pokemon.db"))
+    db.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=25, name="Pikachu"))
+    db.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=26, name="Raichu"))
+    return db
+
+
+class TestMigration:
+    """Test cases for upgrading databases created by earlier versions."""
+
+    def test_snapshot_version_counter_is_dropped(self, database: PokemonDatabase) -> None:
+        """Test that the write counter and triggers of the removed list snapshot are dropped on open."""
+        with sqlite3.connect(database.config.db_path) as conn:
+            conn.execute("CREATE TABLE pokemon_data_version (id INTEGER PRIMARY KEY, version INTEGER NOT NULL)")
+            conn.execute("INSERT INTO pokemon_data_version VALUES (1, 0)")
+            conn.execute(
+                "CREATE TRIGGER bump_pokemon_data_version_on_update AFTER UPDATE ON pokemon_data "
+                "BEGIN UPDATE pokemon_data_version SET version = version + 1 WHERE id = 1; END"
+            )
+
+        PokemonDatabase(config=database.config)
+
+        with sqlite3.connect(database.config.db_path) as conn:
+            leftovers = conn.execute(
+                "SELECT name FROM sqlite_master WHERE name LIKE '%pokemon_data_version%'"
+            ).fetchall()
+        assert leftovers == []
+
+
+class TestGetPokemonByNames:
+    """Test cases for the batched name lookup."""
+
+    def test_mixed_case_names_are_matched(self, database: PokemonDatabase) -> None:
+        """Test that names match regardless of case and are keyed by their lowercased stored name."""
+        found = database.get_pokemon_by_names(names=["PIKACHU", "rAiChU"])
+
+        assert sorted(found) == ["pikachu", "raichu"]
+        assert found["pikachu"].id == 25
+        assert found["raichu"].id == 26
+
+    def test_duplicate_names_are_returned_once(self, database: PokemonDatabase) -> None:
+        """Test that repeated names, in any case, produce a single entry."""
+        found = database.get_pokemon_by_names(names=["Pikachu", "pikachu", "PIKACHU"])
+
+        assert list(found) == ["pikachu"]
+
+    def test_missing_names_are_left_out(self, database: PokemonDatabase) -> None:
+        """Test that only stored Pokémon appear in the result."""
+        assert list(database.get_pokemon_by_names(names=["Pikachu", "Missingno"])) == ["pikachu"]
+        assert database.get_pokemon_by_names(names=[]) == {}
+
+
+class TestSearchPokemonByName:
+    """Test cases for the fuzzy name search."""
+
+    def test_exact_match_is_ranked_first(self, database: PokemonDatabase) -> None:
+        """Test that an exact name match comes before the similar names."""
+        database.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=172, name="Pichu"))
+
+        results = database.search_pokemon_by_name(partial_name="pichu")
+
+        assert [pokemon.name for pokemon in results] == ["Pichu", "Pikachu"]
+
+    def test_typos_are_matched(self, database: PokemonDatabase) -> None:
+        """Test that misspelled names still find the Pokémon."""
+        assert [pokemon.name for pokemon in database.search_pokemon_by_name(partial_name="pikchu")] == ["Pikachu"]
+        assert [pokemon.name for pokemon in database.search_pokemon_by_name(partial_name="RAICHUU")] == ["Raichu"]
+
+    def test_dissimilar_names_are_cut_off(self, database: PokemonDatabase) -> None:
+        """Test that names neither containing the text nor close to it are not suggested."""
+        assert database.search_pokemon_by_name(partial_name="zzzz") == []
+        assert database.search_pokemon_by_name(partial_name="mewtwo") == []
+
+    def test_short_queries_only_match_names_containing_them(self, database: PokemonDatabase) -> None:
+        """Test that a few letters match the names containing them rather than loosely similar ones."""
+        assert database.search_pokemon_by_name(partial_name="abc") == []
+        assert database.search_pokemon_by_name(partial_name="z") == []
+        assert [pokemon.name for pokemon in database.search_pokemon_by_name(partial_name="ai")] == ["Raichu"]
+        assert [pokemon.name for pokemon in database.search_pokemon_by_name(partial_name="pi")] == ["Pikachu"]
+
+    def test_limit_caps_the_results(self, database: PokemonDatabase) -> None:
+        """Test that no more than the requested number of matches is returned."""
+        database.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=172, name="Pichu"))
+
+        assert len(database.search_pokemon_by_name(partial_name="chu")) == 3
+        assert len(database.search_pokemon_by_name(partial_name="chu", limit=2)) == 2
+
+    def test_names_written_by_other_instances_are_found(self, database: PokemonDatabase) -> None:
+        """Test that a Pokémon stored through another instance is found by the next search."""
+        assert database.search_pokemon_by_name(partial_name="pichu")[0].name == "Pikachu"
+
+        other = PokemonDatabase(config=database.config)
+        other.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=172, name="Pichu"))
+
+        assert database.search_pokemon_by_name(partial_name="pichu")[0].name == "Pichu"
+
+
+class TestDatabaseCounts:
+    """Test cases for the row count and the rarity breakdown."""
+
+    def test_row_count_follows_inserts(self, database: PokemonDatabase) -> None:
+        """Test that the row count grows on inserts and is unchanged by updates."""
+        assert database.get_row_count() == 2
+
+        database.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=172, name="Pichu"))
+        assert database.get_row_count() == 3
+
+        database.upsert_pokemon(pokemon_data=replace(_make_pokemon(pokemon_id=172, name="Pichu"), max_cp=400))
+        assert database.get_row_count() == 3
+
+    def test_row_count_is_read_from_existing_file(self, database: PokemonDatabase) -> None:
+        """Test that a new instance counts the Pokémon already stored in the file."""
+        assert PokemonDatabase(config=database.config).get_row_count() == 2
+
+    def test_row_count_sees_other_instances_writes(self, database: PokemonDatabase) -> None:
+        """Test that Pokémon stored through another instance of the same file are counted."""
+        assert database.get_row_count() == 2
+
+        other = PokemonDatabase(config=database.config)
+        other.upsert_pokemon(pokemon_data=_make_pokemon(pokemon_id=172, name="Pichu"))
+
+        assert database.get_row_count() == 3
+
+    def test_rarity_breakdown(self, database: PokemonDatabase) -> None:
+        """Test counts per rarity, with missing rarities grouped as Unknown, and the shiny and released totals."""
+        database.upsert_pokemon(
+            pokemon_data=replace(
+                _make_pokemon(pokemon_id=150, name="Mewtwo", rarity="Legendary"), is_shiny_available=True
+            )
+        )
+        database.upsert_pokemon(
+            pokemon_data=replace(_make_pokemon(pokemon_id=808, name="Meltan", rarity=None), is_released=False)
+        )
+
+        rarity_counts, shiny_count, released_count = database.get_rarity_breakdown()
+
+        assert rarity_counts == {"Standard": 2, "Legendary": 1, "Unknown": 1}
+        assert shiny_count == 1
+        assert released_count == 3
+
+    def test_rarity_breakdown_of_empty_database(self, tmp_path: Path) -> None:
+        """Test that an empty database has no rarities and zero totals."""
+        empty = PokemonDatabase(config=DatabaseConfig(db_path=tmp_path / "empty.db"))
+
+        assert empty.get_rarity_breakdown() == ({}, 0, 0)
+
+
+class TestUpdatePokemonFieldsBulk:
+    """Test cases for the batched shiny availability update."""
+
+    def test_updates_every_listed_pokemon(self, database: PokemonDatabase) -> None:
+        """Test that all listed Pokémon are updated and counted."""
+        updated = database.update_pokemon_fields_bulk(shiny_updates=[(25, True), (26, True)])
+
+        assert updated == 2
+        assert all(pokemon.is_shiny_available for pokemon in database.get_all_pokemon())
+
+    def test_unknown_ids_are_not_counted(self, database: PokemonDatabase) -> None:
+        """Test that ids missing from the database are skipped without failing the batch."""
+        updated = database.update_pokemon_fields_bulk(shiny_updates=[(25, True), (9999, True)])
+
+        assert updated == 1
+        pikachu = database.get_pokemon_by_id(pokemon_id=25)
+        assert pikachu is not None
+        assert pikachu.is_shiny_available is True
+
+    def test_empty_batch_is_a_no_op(self, database: PokemonDatabase) -> None:
+        """Test that an empty batch updates nothing."""
+        assert database.update_pokemon_fields_bulk(shiny_updates=[]) == 0
+        assert not any(pokemon.is_shiny_available for pokemon in database.get_all_pokemon())
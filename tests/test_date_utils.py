@@ -0,0 +1,77 @@
+"""Tests for date utilities module."""
+
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from pokemon_meetup.utils.date_utils import (
+    SpanishDateFormatter,
+    format_spanish_date,
+    get_current_week_info,
+    get_legendary_hour_date,
+    get_next_monday,
+    get_spotlight_tuesday_date,
+    get_weekend_event_date,
+)
+
+
+class TestDateUtils:
+    """Test cases for Spanish date formatting and event date calculation."""
+
+    def test_next_day_of_week_returns_same_day(self) -> None:
+        """Test that the current day is returned when it matches the weekday."""
+        monday = datetime(2025, 6, 2)
+        assert get_next_monday(from_date=monday) == monday
+
+    def test_next_day_of_week_returns_next_occurrence(self) -> None:
+        """Test that the next occurrence is returned for other days."""
+        tuesday = datetime(2025, 6, 3)
+        formatter = SpanishDateFormatter(now=tuesday)
+        assert formatter.next_day_of_week(weekday=0) == datetime(2025, 6, 9)
+        assert formatter.next_day_of_week(weekday=6) == datetime(2025, 6, 8)
+
+    def test_format_spanish_date(self) -> None:
+        """Test full and short Spanish date formats."""
+        date = datetime(2025, 9, 17)
+        assert format_spanish_date(date=date, format_type="full") == "miércoles 17 de septiembre"
+        assert format_spanish_date(date=date, format_type="short") == "17 de septiembre"
+
+    def test_event_dates(self) -> None:
+        """Test formatted dates for weekday and weekend events."""
+        friday = datetime(2025, 6, 6)
+        assert get_legendary_hour_date(day_choice=3, from_date=friday) == "miércoles 11 de junio"
+        assert get_weekend_event_date(day_choice=1, from_date=friday) == "sábado 7 de junio"
+        assert get_weekend_event_date(day_choice=2, from_date=friday) == "domingo 8 de junio"
+
+    def test_weekend_event_rejects_invalid_choice(self) -> None:
+        """Test that weekend events only accept Saturday or Sunday."""
+        with pytest.raises(ValueError):
+            get_weekend_event_date(day_choice=3, from_date=datetime(2025, 6, 6))
+
+    def test_current_week_info(self) -> None:
+        """Test week information relative to the reference date."""
+        info = get_current_week_info(from_date=datetime(2025, 6, 4))
+        assert info["next_monday_date"] == "lunes 9 de junio"
+        assert info["next_monday_short"] == "9 de junio"
+        assert info["is_today_monday"] is False
+        assert info["days_until_monday"] == 5
+        assert info["current_date"] == "miércoles 4 de junio"
+
+    def test_event_date_wrappers_reuse_formatter_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that event date wrappers called for the same day format each date only once."""
+        format_calls = []
+        original_format = SpanishDateFormatter.format
+
+        def counting_format(self: SpanishDateFormatter, **kwargs: Any) -> str:
+            format_calls.append(kwargs["date"])
+            return original_format(self, **kwargs)
+
+        monkeypatch.setattr(SpanishDateFormatter, "format", counting_format)
+
+        morning = datetime(2031, 3, 4, 9, 30)
+        assert get_spotlight_tuesday_date(from_date=morning) == "martes 4 de marzo"
+        assert get_spotlight_tuesday_date(from_date=morning.replace(hour=18)) == "martes 4 de marzo"
+        assert get_legendary_hour_date(day_choice=2, from_date=morning) == "martes 4 de marzo"
+
+        assert format_calls == [datetime(2031, 3, 4)]
@@ -0,0 +1,168 @@
+"""Tests for the PoGo API client."""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pokemon_meetup.web import pokemon_api
+from pokemon_meetup.web.pokemon_api import PoGoAPIClient, search_pokemon_sync
+
+NAMES_BODY = b'{"25": {"id": 25, "name": "Pikachu"}, "26": {"id": 26, "name": "Raichu"}}'
+
+
+@pytest.fixture(autouse=True)
+def _fresh_api_caches() -> Iterator[None]:
+    """Give every test empty process-wide API caches."""
+    PoGoAPIClient.clear_caches()
+    yield
+    PoGoAPIClient.clear_caches()
+
+
+def _revalidating_transport(seen_headers: list[str | None]) -> httpx.MockTransport:
+    """Build a transport that answers with an ETag and honours If-None-Match.
+
+    Args:
+        seen_headers: Receives the If-None-Match header of every request.
+
+    Returns:
+        Mock transport serving NAMES_BODY.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=NAMES_BODY, headers={"ETag": '"v1"'})
+
+    return httpx.MockTransport(handler)
+
+
+async def _fetch_names(*, cache_dir: Path, transport: httpx.AsyncBaseTransport) -> object:
+    """Fetch the names endpoint once with a fresh client."""
+    async with PoGoAPIClient(cache_dir=cache_dir, transport=transport) as client:
+        return await client._fetch_json(endpoint="pokemon_names.json")
+
+
+class TestDiskCache:
+    """Test cases for the persisted responses and their revalidation."""
+
+    def test_not_modified_response_is_served_from_disk(self, tmp_path: Path) -> None:
+        """Test that a 304 to the conditional request returns the stored body."""
+        seen_headers: list[str | None] = []
+        transport = _revalidating_transport(seen_headers)
+
+        first = asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+        second = asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+
+        assert seen_headers == [None, '"v1"']
+        assert first == second
+        assert (tmp_path / "pokemon_names.json").read_bytes() == NAMES_BODY
+
+    def test_unreadable_cached_body_is_fetched_again(self, tmp_path: Path) -> None:
+        """Test that a 304 for a corrupt stored body falls back to an unconditional request."""
+        seen_headers: list[str | None] = []
+        transport = _revalidating_transport(seen_headers)
+        first = asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+        (tmp_path / "pokemon_names.json").write_bytes(b"{not json")
+
+        second = asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+
+        assert seen_headers == [None, '"v1"', None]
+        assert second == first
+        assert (tmp_path / "pokemon_names.json").read_bytes() == NAMES_BODY
+
+    def test_missing_cached_body_is_fetched_without_validators(self, tmp_path: Path) -> None:
+        """Test that validators without a stored body are not sent."""
+        seen_headers: list[str | None] = []
+        transport = _revalidating_transport(seen_headers)
+        asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+        (tmp_path / "pokemon_names.json").unlink()
+
+        data = asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport))
+
+        assert seen_headers == [None, None]
+        assert isinstance(data, dict)
+
+    def test_unconditional_not_modified_is_an_error(self, tmp_path: Path) -> None:
+        """Test that a 304 to a request without validators is not treated as a cache hit."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(304))
+
+        assert asyncio.run(_fetch_names(cache_dir=tmp_path, transport=transport)) is None
+
+
+class TestAPICaches:
+    """Test cases for the process-wide API caches."""
+
+    def test_failed_fetch_is_retried_by_next_lookup(self, tmp_path: Path) -> None:
+        """Test that a failed request leaves the cache unset so a later lookup fills it."""
+        responses = iter([httpx.Response(503), httpx.Response(200, content=NAMES_BODY)])
+
+        async def lookup_twice() -> tuple[dict[int, object], dict[int, object]]:
+            transport = httpx.MockTransport(lambda request: next(responses))
+            async with PoGoAPIClient(cache_dir=tmp_path, transport=transport) as client:
+                failed = await client._get_pokemon_names()
+            async with PoGoAPIClient(cache_dir=tmp_path, transport=transport) as client:
+                return failed, await client._get_pokemon_names()
+
+        failed, names = asyncio.run(lookup_twice())
+
+        assert failed == {}
+        assert names[25] == {"id": 25, "name": "Pikachu"}
+
+    def test_sync_wrapper_runs_during_async_lookup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a sync wrapper on the background loop isn't blocked by locks held on the caller's loop."""
+        background_client = PoGoAPIClient(
+            cache_dir=tmp_path / "background",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=NAMES_BODY)),
+        )
+        monkeypatch.setattr(pokemon_api, "_background_client", background_client)
+
+        async def search_during_lookup() -> list[str]:
+            started = asyncio.Event()
+            release = asyncio.Event()
+
+            async def slow_handler(request: httpx.Request) -> httpx.Response:
+                started.set()
+                await release.wait()
+                return httpx.Response(200, content=NAMES_BODY)
+
+            transport = httpx.MockTransport(slow_handler)
+            async with PoGoAPIClient(cache_dir=tmp_path / "main", transport=transport) as client:
+                # One lookup holds the names lock while a second waits on it, tying the lock to this loop
+                holder = asyncio.create_task(client._get_pokemon_names())
+                await started.wait()
+                waiter = asyncio.create_task(client._get_pokemon_names())
+                await asyncio.sleep(0)
+
+                matches = await asyncio.to_thread(search_pokemon_sync, partial_name="pika")
+
+                release.set()
+                await asyncio.gather(holder, waiter)
+            return matches
+
+        assert asyncio.run(search_during_lookup()) == ["Pikachu"]
+
+
+class TestEvolutionLineMega:
+    """Test cases for the evolution-line mega check."""
+
+    @pytest.mark.parametrize(("pokemon_id", "expected"), [(307, True), (308, True), (25, False), (999, False)])
+    def test_check_evolution_line_has_mega(self, tmp_path: Path, pokemon_id: int, expected: bool) -> None:
+        """Test that a Pokémon counts when it or one of its evolutions has a mega form."""
+        bodies = {
+            "/api/v1/mega_pokemon.json": b'[{"pokemon_id": 308, "mega_name": "Mega Medicham"}]',
+            "/api/v1/pokemon_evolutions.json": (
+                b'[{"pokemon_id": 307, "evolutions": [{"pokemon_id": 308}]},'
+                b' {"pokemon_id": 25, "evolutions": [{"pokemon_id": 26}]}]'
+            ),
+        }
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=bodies[request.url.path]))
+
+        async def check() -> bool:
+            async with PoGoAPIClient(cache_dir=tmp_path, transport=transport) as client:
+                return await client.check_evolution_line_has_mega(pokemon_id=pokemon_id)
+
+        assert asyncio.run(check()) is expected
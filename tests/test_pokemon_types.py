@@ -1,5 +1,7 @@
 """Tests for Pokémon types module."""
 
+import pytest
+
 from pokemon_meetup.common.pokemon_types import PokemonType, get_type_emoji, get_type_spanish_name
 
 
@@ -26,16 +28,16 @@ class TestPokemonTypes:
         assert get_type_emoji(pokemon_type=PokemonType.ELECTRIC) == "⚡️"
         assert get_type_emoji(pokemon_type=PokemonType.GHOST) == "👻"
 
-    def test_all_types_have_spanish_names(self) -> None:
-        """Test that all Pokémon types have Spanish names defined."""
-        for pokemon_type in PokemonType:
-            spanish_name = get_type_spanish_name(pokemon_type=pokemon_type)
-            assert isinstance(spanish_name, str)
-            assert len(spanish_name) > 0
-
-    def test_all_types_have_emojis(self) -> None:
-        """Test that all Pokémon types have emojis defined."""
-        for pokemon_type in PokemonType:
-            emoji = get_type_emoji(pokemon_type=pokemon_type)
-            assert isinstance(emoji, str)
-            assert len(emoji) > 0
+    @pytest.mark.parametrize("pokemon_type", list(PokemonType))
+    def test_all_types_have_spanish_names(self, pokemon_type: PokemonType) -> None:
+        """Test that every Pokémon type has a Spanish name defined."""
+        spanish_name = get_type_spanish_name(pokemon_type=pokemon_type)
+        assert isinstance(spanish_name, str)
+        assert len(spanish_name) > 0
+
+    @pytest.mark.parametrize("pokemon_type", list(PokemonType))
+    def test_all_types_have_emojis(self, pokemon_type: PokemonType) -> None:
+        """Test that every Pokémon type has an emoji defined."""
+        emoji = get_type_emoji(pokemon_type=pokemon_type)
+        assert isinstance(emoji, str)
+        assert len(emoji) > 0